@@ -3,16 +3,16 @@ AI Manager for Dungeons & Daemons.
 Handles all communication with the local LLM through Ollama and LangChain.
 """
 
+import difflib
 import json
+import re
 import subprocess
 import time
 import os
 from typing import Dict, Any, Optional
 from langchain_ollama import OllamaLLM
-from langchain.prompts import PromptTemplate
-from langchain.schema.output_parser import StrOutputParser
 from game_state import GameState
-from prompts import SYSTEM_PROMPT, GAME_PROMPT_TEMPLATE
+from prompts import SYSTEM_PROMPT, build_game_prompt
 
 
 class AIManager:
@@ -26,23 +26,25 @@ class AIManager:
         self.ollama_host = ollama_host
         self.ollama_port = ollama_port
         self.llm = None
-        self.chain = None
         self.fallback_mode = False
+        # Near-duplicate action cache: avoids re-running inference for
+        # rephrased actions like "look" vs "look around" in the same place.
+        self._response_cache: Dict[str, Dict[str, Any]] = {}
         
         try:
-            print("Setting up AI Dungeon Master...")
+            print("Setting up AI Dungeon Master...", flush=True)
             
             # Auto-setup Ollama
             if self._setup_ollama():
                 self._initialize_ai()
-                print("AI Dungeon Master ready!")
+                print("AI Dungeon Master ready!", flush=True)
             else:
-                print("AI setup failed - using fallback story mode")
+                print("AI setup failed - using fallback story mode", flush=True)
                 self.fallback_mode = True
                 
         except Exception as e:
             print(f"AI initialization failed: {e}")
-            print("Using fallback story mode")
+            print("Using fallback story mode", flush=True)
             self.fallback_mode = True
     
     def _setup_ollama(self) -> bool:
@@ -50,14 +52,14 @@ class AIManager:
         try:
             # Check if Ollama is installed
             if not self._check_ollama_installed():
-                print("Ollama not found. Please install Ollama from https://ollama.ai")
+                print("Ollama not found. Please install Ollama from https://ollama.ai", flush=True)
                 return False
             
             # Start Ollama if not running
             if not self._check_ollama_running():
-                print("Starting Ollama service...")
+                print("Starting Ollama service...", flush=True)
                 if not self._start_ollama():
-                    print("Failed to start Ollama")
+                    print("Failed to start Ollama", flush=True)
                     return False
                 
                 # Wait for Ollama to start
@@ -65,15 +67,15 @@ class AIManager:
             
             # Check for available models
             if not self._check_models_available():
-                print(f"Downloading AI model ({self.model_name})...")
+                print(f"Downloading AI model ({self.model_name})...", flush=True)
                 if not self._download_model():
-                    print("Failed to download model")
+                    print("Failed to download model", flush=True)
                     return False
             
             return True
             
         except Exception as e:
-            print(f"Ollama setup failed: {e}")
+            print(f"Ollama setup failed: {e}", flush=True)
             return False
     
     def _check_ollama_installed(self) -> bool:
@@ -105,7 +107,7 @@ class AIManager:
                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except Exception as e:
-            print(f"Failed to start Ollama: {e}")
+            print(f"Failed to start Ollama: {e}", flush=True)
             return False
     
     def _check_models_available(self) -> bool:
@@ -124,61 +126,175 @@ class AIManager:
     def _download_model(self) -> bool:
         """Download the required model."""
         try:
-            print(f"This may take a few minutes for first-time setup...")
+            print(f"This may take a few minutes for first-time setup...", flush=True)
             result = subprocess.run(["ollama", "pull", self.model_name], 
                                   capture_output=True, text=True, timeout=300)
             return result.returncode == 0
         except subprocess.TimeoutExpired:
-            print("Model download timed out")
+            print("Model download timed out", flush=True)
             return False
         except Exception as e:
-            print(f"Model download failed: {e}")
+            print(f"Model download failed: {e}", flush=True)
             return False
     
+    # How long Ollama keeps the model (and its KV cache) loaded between requests
+    _KEEP_ALIVE = "30m"
+
     def _initialize_ai(self):
         """Initialize the AI chain."""
         base_url = f"http://{self.ollama_host}:{self.ollama_port}"
-        
+
         self.llm = OllamaLLM(
             model=self.model_name,
             format="json",
             temperature=self.temperature,
             base_url=base_url,
-        )
-        
-        # Create the chat prompt template
-        prompt = PromptTemplate(
-            template=SYSTEM_PROMPT + "\n\n" + GAME_PROMPT_TEMPLATE,
-            input_variables=["player_name", "current_hp", "max_hp", "current_location", 
-                           "inventory", "story_history", "user_input"]
-        )
-        
-        # Create the chain
-        self.chain = (
-            prompt 
-            | self.llm
-            | StrOutputParser()
+            keep_alive=self._KEEP_ALIVE,
         )
     
+    def warmup(self) -> None:
+        """Pre-fill and pin the system-prompt KV cache on the Ollama server.
+
+        Generating a single token from the shared prompt prefix makes Ollama
+        compute its KV cache for those tokens up front; keep_alive plus
+        num_keep then retain it, so per-turn prefill only covers the
+        turn-specific suffix. Best-effort: failures are ignored.
+        """
+        if self.fallback_mode:
+            return
+        try:
+            import requests
+            requests.post(
+                f"http://{self.ollama_host}:{self.ollama_port}/api/generate",
+                json={
+                    "model": self.model_name,
+                    "prompt": SYSTEM_PROMPT,
+                    "keep_alive": self._KEEP_ALIVE,
+                    "stream": False,
+                    "options": {
+                        "num_predict": 1,
+                        # Rough token estimate (~4 chars/token) for the pinned prefix
+                        "num_keep": len(SYSTEM_PROMPT) // 4,
+                    },
+                },
+                timeout=60,
+            )
+        except Exception:
+            pass
+
+    _CACHE_MAX_ENTRIES = 64
+    _CACHE_SIMILARITY = 0.92
+
+    def reset_response_cache(self) -> None:
+        """Drop all cached responses.
+
+        Called when a new game starts or a save is loaded: keys are only
+        location plus action, so entries from the previous playthrough would
+        otherwise match (exactly or fuzzily) and serve the old character's
+        narrative in the new one.
+        """
+        self._response_cache.clear()
+
+    def _cache_key(self, game_state: GameState, user_input: str) -> str:
+        """Build the cache key for an action in the current location."""
+        return f"{game_state.current_location}|{user_input.lower().strip()}"
+
+    def _cache_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response for this or a near-duplicate action."""
+        cached = self._response_cache.get(key)
+        if cached is None and self._response_cache:
+            matches = difflib.get_close_matches(
+                key, self._response_cache.keys(), n=1, cutoff=self._CACHE_SIMILARITY
+            )
+            if matches:
+                cached = self._response_cache[matches[0]]
+        return dict(cached) if cached is not None else None
+
+    def _cache_store(self, key: str, response: Dict[str, Any]) -> None:
+        """Cache a response if it has no side effects on the game state."""
+        if (response.get("hp_change", 0) == 0
+                and not response.get("items_added")
+                and not response.get("items_removed")):
+            if len(self._response_cache) >= self._CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts preserve insertion order)
+                self._response_cache.pop(next(iter(self._response_cache)))
+            self._response_cache[key] = dict(response)
+
+    # Shared prompt prefix: identical bytes every turn, so Ollama's pinned
+    # KV cache from warmup() keeps covering it
+    _PROMPT_PREFIX = SYSTEM_PROMPT + "\n\n"
+
+    def _build_prompt(self, game_state: GameState, user_input: str) -> str:
+        """Build the full per-turn prompt from the current game state."""
+        player = game_state.player
+        return self._PROMPT_PREFIX + build_game_prompt(
+            player_name=player.name,
+            current_hp=player.hp,
+            max_hp=player.max_hp,
+            current_location=game_state.current_location,
+            inventory=", ".join(player.inventory) if player.inventory else "Empty",
+            story_history=game_state.get_history_text(),
+            user_input=user_input,
+        )
+
+    def get_ai_response_stream(self, game_state: GameState, user_input: str):
+        """Stream the AI response as raw text chunks.
+
+        Cached and fallback responses are yielded as a single pre-serialized
+        chunk so callers can treat every turn the same way. Pass the
+        accumulated text to parse_streamed_response for the final dict.
+        """
+        if self.fallback_mode:
+            yield json.dumps(self._get_fallback_response(game_state, user_input))
+            return
+
+        cached_response = self._cache_lookup(self._cache_key(game_state, user_input))
+        if cached_response is not None:
+            yield json.dumps(cached_response)
+            return
+
+        try:
+            for chunk in self.llm.stream(self._build_prompt(game_state, user_input)):
+                yield chunk
+        except Exception as e:
+            print("AI connection lost - switching to fallback mode")
+            self.fallback_mode = True
+            yield json.dumps(self._get_fallback_response(game_state, user_input))
+
+    def parse_streamed_response(self, game_state: GameState, user_input: str,
+                                raw_response: str) -> Dict[str, Any]:
+        """Parse an accumulated streamed response into the response dict."""
+        # Take the JSON tail so stray partial output before it is ignored
+        match = re.search(r'\{.*\}\s*$', raw_response, re.S)
+        try:
+            parsed_response = json.loads(match.group(0) if match else raw_response)
+        except json.JSONDecodeError:
+            print("AI response parsing failed - switching to fallback mode")
+            self.fallback_mode = True
+            return self._get_fallback_response(game_state, user_input)
+
+        # Ensure all required keys exist
+        required_keys = ["narrative", "location", "hp_change", "items_added", "items_removed"]
+        for key in required_keys:
+            if key not in parsed_response:
+                parsed_response[key] = self._get_default_value(key)
+
+        self._cache_store(self._cache_key(game_state, user_input), parsed_response)
+        return parsed_response
+
     def get_ai_response(self, game_state: GameState, user_input: str) -> Dict[str, Any]:
         """Get AI response with fallback mode support."""
         if self.fallback_mode:
             return self._get_fallback_response(game_state, user_input)
-        
+
+        cache_key = self._cache_key(game_state, user_input)
+        cached_response = self._cache_lookup(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         try:
-            # Prepare the context
-            context = {
-                "player_name": game_state.player.name,
-                "current_hp": game_state.player.hp,
-                "max_hp": game_state.player.max_hp,
-                "current_location": game_state.current_location,
-                "inventory": ", ".join(game_state.player.inventory) if game_state.player.inventory else "Empty",
-                "story_history": game_state.get_history_text(),
-                "user_input": user_input
-            }
-            
             # Get response from AI
-            response = self.chain.invoke(context)
+            response = self.llm.invoke(self._build_prompt(game_state, user_input))
             
             # Parse JSON response
             try:
@@ -192,7 +308,8 @@ class AIManager:
                 for key in required_keys:
                     if key not in parsed_response:
                         parsed_response[key] = self._get_default_value(key)
-                
+
+                self._cache_store(cache_key, parsed_response)
                 return parsed_response
                 
             except json.JSONDecodeError as e:
@@ -363,6 +363,11 @@ BACKGROUNDS = {
 }
 
 
+# Ability modifiers for scores 0-30, indexed by score: one table lookup
+# instead of recomputing (score - 10) // 2 at every use site
+ABILITY_MODIFIERS = tuple((score - 10) // 2 for score in range(31))
+
+
 def get_race_choices() -> List[str]:
     """Get list of available race names."""
     return list(RACES.keys())
@@ -5,6 +5,7 @@ Provides D&D-style dice mechanics with beautiful visual output.
 
 import random
 import re
+import sys
 from typing import List, Tuple, Dict, Any, Optional
 from rich.console import Console
 from rich.panel import Panel
@@ -69,12 +70,18 @@ class DiceRoller:
             20: [str(i) for i in range(1, 21)]
         }
     
+    # Above this many dice, one C-level choices() call beats the randint loop
+    _BULK_ROLL_THRESHOLD = 8
+
     def roll_dice(self, count: int, sides: int, modifier: int = 0, description: str = "") -> DiceResult:
         """Roll dice and return results."""
         if count <= 0 or sides <= 0:
             raise ValueError("Count and sides must be positive integers")
-        
-        rolls = [random.randint(1, sides) for _ in range(count)]
+
+        if count > self._BULK_ROLL_THRESHOLD:
+            rolls = random.choices(range(1, sides + 1), k=count)
+        else:
+            rolls = [random.randint(1, sides) for _ in range(count)]
         return DiceResult(rolls, sides, modifier, description)
     
     def parse_dice_notation(self, notation: str) -> Tuple[int, int, int]:
@@ -216,13 +223,10 @@ class DiceRoller:
         self.console.print(Align.center(rolling_panel))
         time.sleep(0.8)  # Brief pause for drama
         
-        # Clear the rolling message
-        import os
-        if os.name == 'nt':
-            os.system('cls')
-        else:
-            os.system('clear')
-        self.console.clear()
+        # Clear the rolling message with a direct escape write: no shell
+        # spawn, and \x1b[3J drops the scrollback copy too
+        sys.stdout.write('\x1b[2J\x1b[3J\x1b[H')
+        sys.stdout.flush()
     
     def roll_stats(self, method: str = "4d6_drop_lowest") -> Dict[str, int]:
         """Roll D&D ability scores using various methods."""
@@ -4,12 +4,38 @@ Handles character data, game state, and JSON persistence.
 """
 
 import json
+from collections import deque
 from typing import List, Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def serialize_state(state: Dict[str, Any]) -> bytes:
+    """Serialize a state dict to indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class Character:
     """Represents the player character with full D&D-style stats and abilities."""
-    
+
+    # Fixed attribute layout: slot access is an array index instead of a
+    # per-instance dict lookup, and trims per-character memory
+    __slots__ = (
+        "name", "race", "character_class", "level", "background", "alignment",
+        "strength", "dexterity", "constitution",
+        "intelligence", "wisdom", "charisma",
+        "hp", "max_hp", "armor_class", "proficiency_bonus",
+        "skill_proficiencies", "saving_throw_proficiencies",
+        "inventory", "_inventory_set", "equipment",
+        "experience_points", "gold_pieces",
+        "_mod_cache_key", "_mod_cache",
+    )
+
     def __init__(self, name: str, hp: int = 100, max_hp: int = 100, inventory: Optional[List[str]] = None,
                  # D&D Stats
                  strength: int = 10, dexterity: int = 10, constitution: int = 10,
@@ -63,6 +89,8 @@ class Character:
         
         # Inventory and Equipment
         self.inventory = inventory or ["Backpack", "Bedroll", "Rations (5 days)"]
+        # Parallel set for O(1) membership checks; inventory keeps display order
+        self._inventory_set = set(self.inventory)
         self.equipment = equipment or {
             "armor": "Leather Armor",
             "weapon": "Longsword",
@@ -73,7 +101,11 @@ class Character:
         # Progression
         self.experience_points = experience_points
         self.gold_pieces = gold_pieces
-    
+
+        # Cached modifier strings for the UI, keyed on the current stats
+        self._mod_cache_key = None
+        self._mod_cache = ()
+
     def get_ability_modifier(self, ability_score: int) -> int:
         """Calculate D&D ability modifier from score."""
         return (ability_score - 10) // 2
@@ -83,6 +115,31 @@ class Character:
         modifier = self.get_ability_modifier(ability_score)
         return f"+{modifier}" if modifier >= 0 else str(modifier)
     
+    def add_item(self, item: str) -> bool:
+        """Add an item to the inventory if not already carried."""
+        if item in self._inventory_set:
+            return False
+        self.inventory.append(item)
+        self._inventory_set.add(item)
+        return True
+
+    def remove_item(self, item: str) -> bool:
+        """Remove an item from the inventory if carried."""
+        if item not in self._inventory_set:
+            return False
+        self.inventory.remove(item)
+        self._inventory_set.discard(item)
+        return True
+
+    def get_modifier_strings(self) -> tuple:
+        """Get the six formatted modifier strings (STR..CHA), cached until stats change."""
+        stats = (self.strength, self.dexterity, self.constitution,
+                 self.intelligence, self.wisdom, self.charisma)
+        if stats != self._mod_cache_key:
+            self._mod_cache_key = stats
+            self._mod_cache = tuple(self.get_modifier_string(score) for score in stats)
+        return self._mod_cache
+
     def get_stat_modifiers(self) -> Dict[str, int]:
         """Get all ability modifiers."""
         return {
@@ -216,36 +273,40 @@ class GameState:
     def __init__(self, player: Character, story_history: Optional[List[str]] = None, 
                  current_location: str = "Unknown", max_history_turns: int = 10):
         self.player = player
-        self.story_history = story_history or []
+        # Bounded deque: each turn is 2 entries (player + DM), oldest drop in O(1)
+        self.story_history = deque(story_history or (), maxlen=max_history_turns * 2)
         self.current_location = current_location
         self.max_history_turns = max_history_turns
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the full game state to a dictionary for JSON serialization."""
+        return {
+            "player": self.player.to_dict(),
+            "story_history": list(self.story_history),
+            "current_location": self.current_location,
+            "max_history_turns": self.max_history_turns
+        }
+
     def save_to_json(self, file_path: str) -> None:
         """Save the entire game state to a JSON file."""
         import os
-        
+
         # Ensure the directory exists
         save_dir = os.path.dirname(file_path)
         if save_dir and not os.path.exists(save_dir):
             os.makedirs(save_dir, exist_ok=True)
-        
-        game_data = {
-            "player": self.player.to_dict(),
-            "story_history": self.story_history,
-            "current_location": self.current_location,
-            "max_history_turns": self.max_history_turns
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(game_data, f, indent=2, ensure_ascii=False)
+
+        with open(file_path, 'wb') as f:
+            f.write(serialize_state(self.to_dict()))
     
     @classmethod
     def load_from_json(cls, file_path: str) -> Optional['GameState']:
         """Load game state from JSON file. Returns None if file doesn't exist."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                game_data = json.load(f)
-            
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            game_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
             player = Character.from_dict(game_data["player"])
             story_history = game_data.get("story_history", [])
             current_location = game_data.get("current_location", "Unknown")
@@ -263,14 +324,12 @@ class GameState:
         """Add a turn to the story history."""
         self.story_history.append(f"Player: {user_action}")
         self.story_history.append(f"DM: {ai_narrative}")
-    
-    def prune_history(self, max_turns: Optional[int] = None) -> None:
-        """Keep only the most recent turns to prevent context from growing too large."""
-        if max_turns is None:
-            max_turns = self.max_history_turns
-        
-        if len(self.story_history) > max_turns * 2:  # Each turn is 2 entries (player + DM)
-            self.story_history = self.story_history[-(max_turns * 2):]
+
+    def set_max_history_turns(self, max_turns: int) -> None:
+        """Resize the bounded history when the settings value changes."""
+        if max_turns != self.max_history_turns:
+            self.max_history_turns = max_turns
+            self.story_history = deque(self.story_history, maxlen=max_turns * 2)
     
     def get_history_text(self) -> str:
         """Get formatted history text for the AI prompt."""
@@ -4,49 +4,155 @@ Main game loop and entry point with beautiful, professional interface.
 """
 
 import os
+import queue
+import re
 import sys
+import tempfile
+import threading
 from typing import Optional, Dict, Any
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 from rich.prompt import Prompt
 from rich.align import Align
-from rich.columns import Columns
-from rich.layout import Layout
-from rich.console import Group
 
-from game_state import GameState, Character
-from ai_manager import AIManager
+from game_state import GameState, Character, serialize_state
 from settings import SettingsManager
 from menu_system import MenuSystem, MenuChoice
 from ascii_art import Colors, GAME_OVER_ART, get_health_indicator, get_location_prefix, get_item_type, SIMPLE_TITLE
 from error_handler import ErrorHandler, ErrorType, safe_execute
-from dice_system import DiceRoller, d20, d6, d8, d10, d12
+
+# AIManager (pulls in LangChain/Ollama) and DiceRoller are imported lazily so
+# the main menu appears without paying their import cost up front.
+
+# ANSI clear-screen + cursor-home sequence (supported on Windows 10+ terminals)
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Title banner is static; build the styled Text once at import time
+_SIMPLE_TITLE_TEXT = Text(SIMPLE_TITLE, style=Colors.TITLE)
+
+# Matches the (possibly still incomplete) narrative value inside the streamed
+# JSON response so it can be shown while the rest is still generating
+_STREAM_NARRATIVE_RE = re.compile(r'"narrative"\s*:\s*"((?:[^"\\]|\\.)*)')
 
 
 class DungeonsAndDaemons:
     """Main game class for Dungeons & Daemons with beautiful interface."""
-    
+
     def __init__(self):
-        self.console = Console()
+        # No emoji short-codes in game text, so skip Rich's emoji pass
+        self.console = Console(emoji=False)
         self.settings_manager = SettingsManager()
         self.menu_system = MenuSystem(self.settings_manager)
         self.error_handler = ErrorHandler(self.console, self.settings_manager.settings.show_debug_info)
-        self.ai_manager: Optional[AIManager] = None
+        self.ai_manager: Optional["AIManager"] = None
         self.game_state: Optional[GameState] = None
-        self.dice_roller = DiceRoller(self.console)
-    
+        self._dice_roller = None
+
+        # Static renderables reused by display_game_state every frame
+        self._section_labels = {
+            name: Text(name, style=Colors.STAT_LABEL, justify="center")
+            for name in ("ABILITY SCORES", "COMBAT", "DETAILS",
+                         "EQUIPMENT", "INVENTORY", "SKILLS")
+        }
+        self._blank_line = Text("")
+
+        # Slash-command dispatch table for get_user_input
+        self._commands = {
+            '/roll': self.handle_dice_roll,
+            '/check': self.handle_skill_check,
+        }
+
+        # Background auto-save: a one-slot queue coalesces rapid turns so the
+        # game loop never blocks on disk I/O
+        self._save_queue: "queue.Queue" = queue.Queue(maxsize=1)
+        self._last_saved: Optional[bytes] = None
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+
+    def _save_worker(self) -> None:
+        """Drain queued auto-saves, writing each snapshot atomically."""
+        while True:
+            item = self._save_queue.get()
+            if item is None:  # shutdown sentinel from the final save path
+                return
+            save_path, serialized = item
+            try:
+                self._write_save_file(save_path, serialized)
+            except Exception:
+                pass  # auto-save failures must never take down the game loop
+
+    def _stop_save_worker(self) -> None:
+        """Stop the background writer, waiting out any in-flight write.
+
+        Without this, a write the worker already dequeued could land after
+        the synchronous final save and leave an older snapshot on disk.
+        """
+        try:
+            self._save_queue.put(None, timeout=5)
+            self._save_thread.join(timeout=5)
+        except queue.Full:
+            pass  # worker wedged; the final save still proceeds
+
+    @staticmethod
+    def _write_save_file(save_path: str, serialized: bytes) -> None:
+        """Write serialized save data to a temp file and atomically replace the target."""
+        save_dir = os.path.dirname(save_path)
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=save_dir or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(serialized)
+            os.replace(tmp_path, save_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _queue_auto_save(self, save_path: str) -> None:
+        """Snapshot the game state and hand it to the background save worker."""
+        serialized = serialize_state(self.game_state.to_dict())
+        if serialized == self._last_saved:
+            return  # nothing changed since the last save
+        self._last_saved = serialized
+        try:
+            self._save_queue.put_nowait((save_path, serialized))
+        except queue.Full:
+            # Replace the pending (now stale) snapshot with the newest one
+            try:
+                self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait((save_path, serialized))
+
+    @property
+    def dice_roller(self) -> "DiceRoller":
+        """Create the dice roller on first use so dice_system loads lazily."""
+        if self._dice_roller is None:
+            from dice_system import DiceRoller
+            self._dice_roller = DiceRoller(self.console)
+        return self._dice_roller
+
+    def _fast_clear(self) -> None:
+        """Clear the terminal with one ANSI write instead of spawning a shell."""
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+
     def initialize_ai_manager(self) -> bool:
         """Initialize the AI manager with automatic setup."""
         try:
+            from ai_manager import AIManager
             self.ai_manager = AIManager(
                 model_name=self.settings_manager.settings.ai_model,
                 temperature=self.settings_manager.settings.ai_temperature,
                 ollama_host=self.settings_manager.settings.ollama_host,
                 ollama_port=self.settings_manager.settings.ollama_port
             )
+            # Pre-fill the system-prompt KV cache so the first turn only
+            # pays for its own tokens
+            self.ai_manager.warmup()
             return True
             
         except Exception as e:
@@ -74,9 +180,13 @@ class DungeonsAndDaemons:
         
         if success and game_state:
             self.game_state = game_state
-            
+
+            # The AI manager outlives individual playthroughs; drop cached
+            # responses so this save never sees the previous game's narrative
+            self.ai_manager.reset_response_cache()
+
             # Update history length setting
-            self.game_state.max_history_turns = self.settings_manager.settings.max_history_turns
+            self.game_state.set_max_history_turns(self.settings_manager.settings.max_history_turns)
             
             success_text = Text()
             success_text.append("Game loaded successfully! Continuing adventure...", style=Colors.SUCCESS)
@@ -90,10 +200,8 @@ class DungeonsAndDaemons:
             self.console.print(success_panel)
             
             # Clear screen before starting game
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-            self.console.clear()
-            
+            self._fast_clear()
+
             return True
         
         return False
@@ -109,6 +217,10 @@ class DungeonsAndDaemons:
         if not self.ai_manager and not self.initialize_ai_manager():
             return False
         
+        # The AI manager outlives individual playthroughs; drop cached
+        # responses so the new hero never sees the previous game's narrative
+        self.ai_manager.reset_response_cache()
+
         # Create new character with full D&D stats
         player = Character(**character_data)
         
@@ -134,36 +246,33 @@ class DungeonsAndDaemons:
             self.menu_system.animated_loading(2.0)
             
             # Clear screen after loading animation
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-            self.console.clear()
-            
-            # Create rich initial prompt based on character
-            initial_prompt = (
-                f"Start a new D&D-style fantasy RPG adventure for {character_data['name']}, "
-                f"a {character_data['race']} {character_data['character_class']} with the {character_data['background']} background. "
-                f"Character stats: STR {character_data['strength']}, DEX {character_data['dexterity']}, "
-                f"CON {character_data['constitution']}, INT {character_data['intelligence']}, "
-                f"WIS {character_data['wisdom']}, CHA {character_data['charisma']}. "
-                f"They begin in a village square, having just arrived to start their adventuring career. "
-                f"Create an engaging opening scenario that reflects their background and abilities, "
-                f"setting up meaningful choices and potential for adventure."
+            self._fast_clear()
+
+            # Create initial prompt: static instructions first, character data last,
+            # so the prompt prefix is identical for every new character
+            from prompts import build_new_game_prompt
+            initial_prompt = build_new_game_prompt(
+                name=character_data["name"],
+                race=character_data["race"],
+                character_class=character_data["character_class"],
+                background=character_data["background"],
+                strength=character_data["strength"],
+                dexterity=character_data["dexterity"],
+                constitution=character_data["constitution"],
+                intelligence=character_data["intelligence"],
+                wisdom=character_data["wisdom"],
+                charisma=character_data["charisma"]
             )
-            
+
             response = self.ai_manager.get_ai_response(self.game_state, initial_prompt)
             self.update_game_state(response, f"Begin adventure as {character_data['name']}")
             
             # Auto-save the initial state
             if self.settings_manager.settings.auto_save:
-                safe_execute(
-                    lambda: self.game_state.save_to_json(
-                        self.settings_manager.get_save_path(f"{character_data['name']}_save.json")
-                    ),
-                    self.error_handler,
-                    ErrorType.SAVE_LOAD,
-                    f"Auto-saving game for {character_data['name']}"
+                self._queue_auto_save(
+                    self.settings_manager.get_save_path(f"{character_data['name']}_save.json")
                 )
-            
+
             return True
             
         except Exception as e:
@@ -173,27 +282,33 @@ class DungeonsAndDaemons:
     
     def display_game_state(self, narrative: str = None) -> None:
         """Display the current game state with clean UI and side-by-side character info/inventory panels."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
-        self.console.clear()
-        self.console.print("\n")
-        title_text = Text(SIMPLE_TITLE, style=Colors.TITLE)
-        self.console.print(Align.center(title_text))
-        self.console.print()
+        # Bind the hot Colors attributes to locals once per frame
+        info_c = Colors.INFO
+        accent_c = Colors.ACCENT
+        stat_label_c = Colors.STAT_LABEL
+        stat_value_c = Colors.STAT_VALUE
+        selected_c = Colors.SELECTED
+        muted_c = Colors.MUTED
+        narrative_c = Colors.NARRATIVE
+
+        self._fast_clear()
+        # Collect the whole frame and print it once at the end
+        blank_line = self._blank_line
+        frame = [blank_line, blank_line, Align.center(_SIMPLE_TITLE_TEXT), blank_line]
         if narrative:
             narrative_lines = narrative.split("\n")
-            narrative_group = Group(*[Align.center(Text(line, style=Colors.NARRATIVE)) for line in narrative_lines])
+            narrative_group = Group(*[Align.center(Text(line, style=narrative_c)) for line in narrative_lines])
             narrative_panel = Panel(
                 narrative_group,
                 title="Current Scene",
                 title_align="center",
-                style=Colors.INFO,
-                border_style=Colors.ACCENT,
+                style=info_c,
+                border_style=accent_c,
                 padding=(2, 3),
                 width=100
             )
-            self.console.print(Align.center(narrative_panel))
-            self.console.print()
+            frame.append(Align.center(narrative_panel))
+            frame.append(blank_line)
         # Character Info (left) - Full D&D Character Sheet
         hp_ratio = self.game_state.player.hp / self.game_state.player.max_hp
         if hp_ratio > 0.7:
@@ -204,122 +319,127 @@ class DungeonsAndDaemons:
             hp_color = Colors.HEALTH_LOW
         health_indicator = get_health_indicator(self.game_state.player.hp, self.game_state.player.max_hp)
         location_prefix = get_location_prefix(self.game_state.current_location)
-        
-        # Get character modifiers
+
+        # Get character modifiers (cached on the Character until stats change)
         player = self.game_state.player
-        str_mod = player.get_modifier_string(player.strength)
-        dex_mod = player.get_modifier_string(player.dexterity)
-        con_mod = player.get_modifier_string(player.constitution)
-        int_mod = player.get_modifier_string(player.intelligence)
-        wis_mod = player.get_modifier_string(player.wisdom)
-        cha_mod = player.get_modifier_string(player.charisma)
-        
+        str_mod, dex_mod, con_mod, int_mod, wis_mod, cha_mod = player.get_modifier_strings()
+
+        section_labels = self._section_labels
         char_info_lines = [
-            Text(f"{player.name}", style=Colors.SELECTED, justify="center"),
-            Text(f"{player.race} {player.character_class} (Lvl {player.level})", style=Colors.INFO, justify="center"),
-            Text(f"{player.background}", style=Colors.MUTED, justify="center"),
-            Text(""),  # Empty line
-            
+            Text(f"{player.name}", style=selected_c, justify="center"),
+            Text(f"{player.race} {player.character_class} (Lvl {player.level})", style=info_c, justify="center"),
+            Text(f"{player.background}", style=muted_c, justify="center"),
+            blank_line,
+
             # Core Stats
-            Text("ABILITY SCORES", style=Colors.STAT_LABEL, justify="center"),
-            Text(f"STR {player.strength:2d} ({str_mod:>3s})  DEX {player.dexterity:2d} ({dex_mod:>3s})", style=Colors.STAT_VALUE),
-            Text(f"CON {player.constitution:2d} ({con_mod:>3s})  INT {player.intelligence:2d} ({int_mod:>3s})", style=Colors.STAT_VALUE),
-            Text(f"WIS {player.wisdom:2d} ({wis_mod:>3s})  CHA {player.charisma:2d} ({cha_mod:>3s})", style=Colors.STAT_VALUE),
-            Text(""),  # Empty line
-            
+            section_labels["ABILITY SCORES"],
+            Text(f"STR {player.strength:2d} ({str_mod:>3s})  DEX {player.dexterity:2d} ({dex_mod:>3s})", style=stat_value_c),
+            Text(f"CON {player.constitution:2d} ({con_mod:>3s})  INT {player.intelligence:2d} ({int_mod:>3s})", style=stat_value_c),
+            Text(f"WIS {player.wisdom:2d} ({wis_mod:>3s})  CHA {player.charisma:2d} ({cha_mod:>3s})", style=stat_value_c),
+            blank_line,
+
             # Combat Stats
-            Text("COMBAT", style=Colors.STAT_LABEL, justify="center"),
-            Text("HP:", style=Colors.STAT_LABEL) + Text(f" {health_indicator} {player.hp}/{player.max_hp}", style=hp_color),
-            Text("AC:", style=Colors.STAT_LABEL) + Text(f" {player.armor_class}", style=Colors.STAT_VALUE),
-            Text("Prof:", style=Colors.STAT_LABEL) + Text(f" +{player.proficiency_bonus}", style=Colors.STAT_VALUE),
-            Text(""),  # Empty line
-            
+            section_labels["COMBAT"],
+            Text("HP:", style=stat_label_c) + Text(f" {health_indicator} {player.hp}/{player.max_hp}", style=hp_color),
+            Text("AC:", style=stat_label_c) + Text(f" {player.armor_class}", style=stat_value_c),
+            Text("Prof:", style=stat_label_c) + Text(f" +{player.proficiency_bonus}", style=stat_value_c),
+            blank_line,
+
             # Other Info
-            Text("DETAILS", style=Colors.STAT_LABEL, justify="center"),
-            Text("XP:", style=Colors.STAT_LABEL) + Text(f" {player.experience_points}", style=Colors.STAT_VALUE),
-            Text("Gold:", style=Colors.STAT_LABEL) + Text(f" {player.gold_pieces} GP", style=Colors.STAT_VALUE),
-            Text("Location:", style=Colors.STAT_LABEL) + Text(f" {location_prefix} {self.game_state.current_location}", style=Colors.STAT_VALUE)
+            section_labels["DETAILS"],
+            Text("XP:", style=stat_label_c) + Text(f" {player.experience_points}", style=stat_value_c),
+            Text("Gold:", style=stat_label_c) + Text(f" {player.gold_pieces} GP", style=stat_value_c),
+            Text("Location:", style=stat_label_c) + Text(f" {location_prefix} {self.game_state.current_location}", style=stat_value_c)
         ]
         char_info_group = Group(*[Align.left(line) for line in char_info_lines])
         char_info_panel = Panel(
             char_info_group,
             title="Character Sheet",
             title_align="center",
-            style=Colors.ACCENT,
-            border_style=Colors.ACCENT,
+            style=accent_c,
+            border_style=accent_c,
             padding=(1, 2),
             width=50
         )
         # Equipment & Inventory (right)
         equipment_lines = []
-        
+
         # Equipment Section
-        equipment_lines.append(Text("EQUIPMENT", style=Colors.STAT_LABEL, justify="center"))
+        equipment_lines.append(section_labels["EQUIPMENT"])
         equipment = player.equipment
         if equipment.get("armor"):
-            equipment_lines.append(Text(f"Armor: {equipment['armor']}", style=Colors.STAT_VALUE))
+            equipment_lines.append(Text(f"Armor: {equipment['armor']}", style=stat_value_c))
         if equipment.get("weapon"):
-            equipment_lines.append(Text(f"Weapon: {equipment['weapon']}", style=Colors.STAT_VALUE))
+            equipment_lines.append(Text(f"Weapon: {equipment['weapon']}", style=stat_value_c))
         if equipment.get("shield"):
-            equipment_lines.append(Text(f"Shield: {equipment['shield']}", style=Colors.STAT_VALUE))
-        
-        equipment_lines.append(Text(""))  # Empty line
-        
-        # Inventory Section
-        equipment_lines.append(Text("INVENTORY", style=Colors.STAT_LABEL, justify="center"))
-        if self.game_state.player.inventory:
-            for item in self.game_state.player.inventory[:8]:  # Show first 8 items
-                item_icon = get_item_type(item)
-                equipment_lines.append(Text(f"{item_icon} {item}", style=Colors.STAT_VALUE))
-            if len(self.game_state.player.inventory) > 8:
-                equipment_lines.append(Text(f"... and {len(self.game_state.player.inventory) - 8} more", style=Colors.MUTED))
+            equipment_lines.append(Text(f"Shield: {equipment['shield']}", style=stat_value_c))
+
+        equipment_lines.append(blank_line)
+
+        # Inventory Section - fast paths for the common empty / single-item cases
+        equipment_lines.append(section_labels["INVENTORY"])
+        inventory = player.inventory
+        if not inventory:
+            equipment_lines.append(Text("[Empty]", style=muted_c))
+        elif len(inventory) == 1:
+            item = inventory[0]
+            equipment_lines.append(Text(f"{get_item_type(item)} {item}", style=stat_value_c))
         else:
-            equipment_lines.append(Text("[Empty]", style=Colors.MUTED))
-        
+            equipment_lines.append(Text(
+                "\n".join(f"{get_item_type(item)} {item}" for item in inventory[:8]),  # Show first 8 items
+                style=stat_value_c
+            ))
+            if len(inventory) > 8:
+                equipment_lines.append(Text(f"... and {len(inventory) - 8} more", style=muted_c))
+
         # Skills Section (if any)
         if hasattr(player, 'skill_proficiencies') and player.skill_proficiencies:
-            equipment_lines.append(Text(""))  # Empty line
-            equipment_lines.append(Text("SKILLS", style=Colors.STAT_LABEL, justify="center"))
+            equipment_lines.append(blank_line)
+            equipment_lines.append(section_labels["SKILLS"])
             for skill in player.skill_proficiencies[:4]:  # Show first 4 skills
-                equipment_lines.append(Text(f"• {skill}", style=Colors.INFO))
+                equipment_lines.append(Text(f"• {skill}", style=info_c))
             if len(player.skill_proficiencies) > 4:
-                equipment_lines.append(Text(f"... +{len(player.skill_proficiencies) - 4} more", style=Colors.MUTED))
-        
+                equipment_lines.append(Text(f"... +{len(player.skill_proficiencies) - 4} more", style=muted_c))
+
         inventory_group = Group(*[Align.left(line) for line in equipment_lines])
         inventory_panel = Panel(
             inventory_group,
             title="Equipment & Gear",
             title_align="center",
-            style=Colors.ACCENT,
-            border_style=Colors.ACCENT,
+            style=accent_c,
+            border_style=accent_c,
             padding=(1, 2),
             width=50
         )
         # Show side-by-side
-        self.console.print(Align.center(Columns([char_info_panel, inventory_panel], align="center", expand=False)))
-        self.console.print()
+        from rich.columns import Columns
+        frame.append(Align.center(Columns([char_info_panel, inventory_panel], align="center", expand=False)))
+        frame.append(blank_line)
         # Debug info if enabled
         if self.settings_manager.settings.show_debug_info:
             debug_lines = [
                 f"History: {len(self.game_state.story_history)} entries",
                 f"AI Model: {self.settings_manager.settings.ai_model}"
             ]
-            debug_group = Group(*[Align.center(Text(line, style=Colors.MUTED)) for line in debug_lines])
+            debug_group = Group(*[Align.center(Text(line, style=muted_c)) for line in debug_lines])
             debug_panel = Panel(
                 debug_group,
                 title="Debug Info",
                 title_align="center",
-                style=Colors.MUTED,
-                border_style=Colors.MUTED,
+                style=muted_c,
+                border_style=muted_c,
                 padding=(1, 2),
                 width=80
             )
-            self.console.print(Align.center(debug_panel))
-            self.console.print()
-    
+            frame.append(Align.center(debug_panel))
+            frame.append(blank_line)
+        self.console.print(Group(*frame))
+
     def check_game_over(self) -> bool:
         """Check if the game is over with beautiful game over screen and centered text."""
         if self.game_state.player.hp <= 0:
+            error_c = Colors.ERROR
+            muted_c = Colors.MUTED
             self.console.clear()
             game_over_lines = [
                 "G A M E   O V E R",
@@ -330,16 +450,15 @@ class DungeonsAndDaemons:
                 "",
                 "Press Enter to return to menu"
             ]
-            game_over_group = Group(*[Align.center(Text(line, style=Colors.ERROR if i < 3 else Colors.MUTED)) for i, line in enumerate(game_over_lines)])
+            game_over_group = Group(*[Align.center(Text(line, style=error_c if i < 3 else muted_c)) for i, line in enumerate(game_over_lines)])
             game_over_panel = Panel(
                 game_over_group,
-                style=Colors.ERROR,
-                border_style=Colors.ERROR,
+                style=error_c,
+                border_style=error_c,
                 padding=(2, 3),
                 width=80
             )
-            self.console.print(Align.center(game_over_panel))
-            self.console.print()
+            self.console.print(Group(Align.center(game_over_panel), self._blank_line))
             if Prompt.ask("", choices=[""], default="") == "":
                 return True
         return False
@@ -347,38 +466,33 @@ class DungeonsAndDaemons:
     def get_user_input(self) -> Optional[str]:
         """Get user input with clean prompt and screen clearing."""
         try:
-            action_prompt = Text()
-            action_prompt.append("What do you do?", style=Colors.INFO)
-            action_prompt.append(" (type 'menu' to return, or '/roll XdY' for dice)", style=Colors.MUTED)
-            
-            user_input = Prompt.ask(action_prompt).strip()
-            
-            # Handle dice roll commands
-            if user_input.lower().startswith('/roll '):
-                dice_notation = user_input[6:].strip()  # Remove '/roll '
-                self.handle_dice_roll(dice_notation)
-                return self.get_user_input()  # Get another input after rolling
-            
-            # Handle other special commands
-            if user_input.lower().startswith('/check '):
-                skill_name = user_input[7:].strip()
-                self.handle_skill_check(skill_name)
-                return self.get_user_input()  # Get another input after check
-            
-            # Clear screen after input for clean look
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-            self.console.clear()
-            
-            # Handle quit commands
-            if user_input.lower() in ['quit', 'exit', 'q', 'menu']:
-                return None
-            
-            if not user_input:
-                return self.get_user_input()  # Try again if empty input
-                
-            return user_input
-            
+            while True:
+                action_prompt = Text()
+                action_prompt.append("What do you do?", style=Colors.INFO)
+                action_prompt.append(" (type 'menu' to return, or '/roll XdY' for dice)", style=Colors.MUTED)
+
+                user_input = Prompt.ask(action_prompt).strip()
+                lowered = user_input.lower()
+
+                # Handle slash commands (/roll, /check) via the dispatch table
+                parts = user_input.split(None, 1)
+                handler = self._commands.get(parts[0].lower()) if parts else None
+                if handler is not None:
+                    handler(parts[1].strip() if len(parts) > 1 else "")
+                    continue  # Get another input after the command
+
+                # Clear screen after input for clean look
+                self._fast_clear()
+
+                # Handle quit commands
+                if lowered in ('quit', 'exit', 'q', 'menu'):
+                    return None
+
+                if not user_input:
+                    continue  # Try again if empty input
+
+                return user_input
+
         except KeyboardInterrupt:
             return None
     
@@ -414,22 +528,28 @@ class DungeonsAndDaemons:
             return
         
         player = self.game_state.player
-        
+
+        # Bind the hot Colors attributes to locals once per check
+        success_c = Colors.SUCCESS
+        warning_c = Colors.WARNING
+        error_c = Colors.ERROR
+        muted_c = Colors.MUTED
+
         # Get skill modifier
         try:
             skill_modifier = player.get_skill_modifier(skill_name.title())
             result = self.dice_roller.roll_dice(1, 20, skill_modifier, f"{skill_name.title()} Check")
-            
+
             # Determine success based on difficulty (simplified)
             if result.total >= 15:
                 success_text = "SUCCESS!"
-                success_color = Colors.SUCCESS
+                success_color = success_c
             elif result.total >= 10:
                 success_text = "PARTIAL SUCCESS"
-                success_color = Colors.WARNING
+                success_color = warning_c
             else:
                 success_text = "FAILURE"
-                success_color = Colors.ERROR
+                success_color = error_c
             
             self.dice_roller.display_roll_result(result, show_animation=True)
             
@@ -446,23 +566,38 @@ class DungeonsAndDaemons:
             # Wait for user to continue
             self.console.print()
             continue_prompt = Text()
-            continue_prompt.append("Press Enter to continue...", style=Colors.MUTED)
+            continue_prompt.append("Press Enter to continue...", style=muted_c)
             Prompt.ask(continue_prompt, default="")
-            
+
         except Exception as e:
             error_panel = Panel(
                 f"Unknown skill: {skill_name}\nTry: Athletics, Perception, Stealth, etc.",
-                style=Colors.ERROR,
-                border_style=Colors.ERROR,
+                style=error_c,
+                border_style=error_c,
                 title="Skill Check Error"
             )
             self.console.print(Align.center(error_panel))
-            
+
             self.console.print()
             continue_prompt = Text()
-            continue_prompt.append("Press Enter to continue...", style=Colors.MUTED)
+            continue_prompt.append("Press Enter to continue...", style=muted_c)
             Prompt.ask(continue_prompt, default="")
     
+    def _stream_ai_turn(self, user_input: str) -> Dict[str, Any]:
+        """Stream the AI response, showing the narrative as it is generated."""
+        from rich.live import Live
+
+        buffer = ""
+        with Live(Text("", style=Colors.NARRATIVE), console=self.console,
+                  refresh_per_second=20) as live:
+            for chunk in self.ai_manager.get_ai_response_stream(self.game_state, user_input):
+                buffer += chunk
+                match = _STREAM_NARRATIVE_RE.search(buffer)
+                if match:
+                    partial = match.group(1).replace('\\"', '"').replace("\\n", "\n")
+                    live.update(Text(partial, style=Colors.NARRATIVE))
+        return self.ai_manager.parse_streamed_response(self.game_state, user_input, buffer)
+
     def update_game_state(self, ai_response: dict, user_action: str) -> None:
         """Update game state based on AI response."""
         # Update HP
@@ -474,37 +609,37 @@ class DungeonsAndDaemons:
         if ai_response.get("location"):
             self.game_state.current_location = ai_response["location"]
         
-        # Update inventory
-        items_added = ai_response.get("items_added", [])
-        items_removed = ai_response.get("items_removed", [])
-        
-        for item in items_added:
-            if item and item not in self.game_state.player.inventory:
-                self.game_state.player.inventory.append(item)
-        
-        for item in items_removed:
-            if item in self.game_state.player.inventory:
-                self.game_state.player.inventory.remove(item)
-        
-        # Add to story history
-        narrative = ai_response.get("narrative", "Nothing happens...")
-        self.game_state.add_to_history(user_action, narrative)
-        
-        # Prune history based on settings
-        self.game_state.prune_history(self.settings_manager.settings.max_history_turns)
+        # Update inventory - skip the loops entirely on narrative-only turns
+        items_added = ai_response.get("items_added")
+        if items_added:
+            for item in items_added:
+                if item:
+                    self.game_state.player.add_item(item)
+
+        items_removed = ai_response.get("items_removed")
+        if items_removed:
+            for item in items_removed:
+                self.game_state.player.remove_item(item)
+
+        # Add to story history (the bounded deque drops the oldest turn itself)
+        narrative = ai_response.get("narrative")
+        if narrative:
+            self.game_state.add_to_history(user_action, narrative)
     
     def run_game_loop(self) -> None:
         """Main game loop with beautiful interface."""
         if not self.game_state:
             return
-        
+
+        info_c = Colors.INFO
+        accent_c = Colors.ACCENT
+
         # Get initial narrative
         latest_narrative = "Your adventure continues..."
-        if self.game_state.story_history:
-            for entry in reversed(self.game_state.story_history):
-                if entry.startswith("DM: "):
-                    latest_narrative = entry[4:]  # Remove "DM: " prefix
-                    break
+        for entry in reversed(self.game_state.story_history):
+            if entry.startswith("DM: "):
+                latest_narrative = entry[4:]
+                break
         
         while True:
             # Display current state
@@ -521,27 +656,27 @@ class DungeonsAndDaemons:
             
             # Show clean thinking message
             thinking_text = Text()
-            thinking_text.append("The Oracle consults the cosmic tapestry...", style=Colors.INFO)
-            
+            thinking_text.append("The Oracle consults the cosmic tapestry...", style=info_c)
+
             thinking_panel = Panel(
                 Align.center(thinking_text),
-                style=Colors.INFO,
-                border_style=Colors.ACCENT,
+                style=info_c,
+                border_style=accent_c,
                 padding=(1, 2)
             )
             self.console.print(thinking_panel)
             
             try:
-                # Get AI response
-                ai_response = self.ai_manager.get_ai_response(self.game_state, user_input)
-                
+                # Get AI response, streaming the narrative as it arrives
+                ai_response = self._stream_ai_turn(user_input)
+
                 # Update game state
                 self.update_game_state(ai_response, user_input)
                 
-                # Auto-save if enabled
+                # Auto-save if enabled (handled off-thread)
                 if self.settings_manager.settings.auto_save:
                     save_path = self.settings_manager.get_save_path(f"{self.game_state.player.name}_save.json")
-                    self.game_state.save_to_json(save_path)
+                    self._queue_auto_save(save_path)
                 
                 # Update narrative for next iteration
                 latest_narrative = ai_response.get("narrative", "The Oracle remains mysteriously silent...")
@@ -617,6 +752,9 @@ class DungeonsAndDaemons:
             # Final save if we have an active game
             if self.game_state and self.settings_manager.settings.auto_save:
                 try:
+                    # Shut the background writer down first so the
+                    # synchronous final write deterministically wins
+                    self._stop_save_worker()
                     save_path = self.settings_manager.get_save_path(f"{self.game_state.player.name}_save.json")
                     self.game_state.save_to_json(save_path)
                 except Exception:
@@ -3,25 +3,132 @@ Menu system for Dungeons & Daemons.
 Redesigned for beautiful, elegant interface with natural flow.
 """
 
+import operator
 import os
+import random
+import re
+import sys
 import time
 from typing import Optional, List, Callable, Dict, Any
 from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain, islice
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.prompt import Prompt, Confirm, IntPrompt, FloatPrompt
+from rich.prompt import Prompt, Confirm
 from rich.align import Align
-from rich.columns import Columns
-from rich.layout import Layout
-from rich.padding import Padding
 from rich.console import Group
 
 from ascii_art import TITLE_ART, CHARACTER_ART, Colors, get_random_loading_message, SIMPLE_TITLE
+from character_data import (
+    get_race_choices, get_class_choices, get_background_choices,
+    ABILITY_MODIFIERS, RACES, CLASSES, BACKGROUNDS,
+    apply_racial_bonuses, get_racial_proficiencies,
+    get_class_proficiencies, get_background_proficiencies,
+    calculate_starting_hp, calculate_armor_class
+)
 from settings import SettingsManager
-from dice_system import DiceRoller
+
+# Shared Console: terminal detection runs once, and the menus render styled
+# Text objects so markup/emoji/highlight scanning is dead weight per print
+_CONSOLE = Console(highlight=False, markup=False, emoji=False)
+
+# Static title texts shared across menu screens, built once at import time
+_SIMPLE_TITLE_TEXT = Text(SIMPLE_TITLE, style=Colors.TITLE)
+_DND_TITLE_TEXT = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
+
+# Translation table for turning save filenames into display names
+_NAME_TRANS = str.maketrans('_', ' ')
+
+
+@lru_cache(maxsize=1024)
+def _centered(text: str, style: str) -> Align:
+    """Cached Align.center(Text(...)); menu strings are a small finite set."""
+    return Align.center(Text(text, style=style))
+
+
+def _centered_block(lines, style: str) -> Text:
+    """One multi-line centered Text instead of per-line Align/Text wrappers."""
+    return Text("\n".join(lines), justify="center", style=style)
+
+
+@lru_cache(maxsize=16)
+def _settings_panel_for(ai_model, temperature, save_dir, max_history,
+                        auto_save, debug, animation_speed, host, port) -> Panel:
+    """Settings panel for one combination of values; revisits with unchanged
+    settings reuse the cached Panel instead of rebuilding Text and Panel."""
+    settings_lines = [
+        f"AI Model: {ai_model}",
+        f"Temperature: {temperature}",
+        f"Save Directory: {save_dir}",
+        f"Max History: {max_history} turns",
+        f"Auto Save: {'[Enabled]' if auto_save else '[Disabled]'}",
+        f"Debug Mode: {'[Enabled]' if debug else '[Disabled]'}",
+        f"Animation Speed: {animation_speed}s",
+        f"Ollama: {host}:{port}"
+    ]
+    return Panel(
+        _centered_block(settings_lines, Colors.INFO),
+        title="Current Settings",
+        title_align="center",
+        style=Colors.INFO,
+        border_style=Colors.INFO,
+        padding=(2, 4),
+        width=75
+    )
+
+
+@lru_cache(maxsize=64)
+def _format_mtime_minute(minute: int) -> str:
+    """Format a save-file mtime (floored to the minute) for the load menu.
+
+    The display granularity is minutes, so caching on ``mtime // 60`` lets
+    repeated menu opens skip localtime/strftime for unchanged files.
+    """
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+
+
+# Character names: 1-20 chars starting with a letter, then letters, spaces,
+# apostrophes, or hyphens (so Sera-Lyn and O'Malley both pass)
+_NAME_RE = re.compile(r"[A-Za-z](?:[A-Za-z '\-]{0,19})\Z")
+
+# Static prompt texts, assembled once at import instead of per Prompt.ask call
+_MAIN_MENU_PROMPT = Text.assemble(("Choose your path", Colors.INFO), (" (1-5)", Colors.MUTED))
+_NAME_PROMPT = Text.assemble(("Enter your hero's name", Colors.INFO), (" (or 'back' to return)", Colors.MUTED))
+_STAT_METHOD_PROMPT = Text.assemble(("Choose method", Colors.INFO), (" (1-4, or 'back')", Colors.MUTED))
+_BEGIN_ADVENTURE_PROMPT = Text.assemble(("Begin your legendary adventure?", Colors.INFO))
+_LOAD_SLOT_PROMPT = Text.assemble(("Select adventure slot", Colors.INFO), (" (or 'back' to return)", Colors.MUTED))
+_SETTINGS_PROMPT = Text.assemble(("Select option", Colors.INFO))
+_MODEL_PROMPT = Text.assemble(("Select model number", Colors.INFO), (" (or 'r' to refresh)", Colors.MUTED))
+_TEMPERATURE_PROMPT = Text.assemble(("Enter temperature (0.0-2.0)", Colors.INFO))
+_SAVE_DIR_PROMPT = Text.assemble(("Enter save directory path", Colors.INFO))
+_HISTORY_PROMPT = Text.assemble(("Enter history length (10-200)", Colors.INFO))
+_RESET_CONFIRM_PROMPT = Text.assemble(("Reset all settings to defaults?", Colors.WARNING))
+_RETURN_PROMPT = Text.assemble(("Press Enter to return to menu...", Colors.MUTED))
+_QUIT_CONFIRM_PROMPT = Text.assemble(("Are you sure you want to leave this magical realm?", Colors.WARNING))
+
+# Starting gear every new character carries before background equipment
+_BASE_INVENTORY = ("Backpack", "Bedroll", "Rations (5 days)")
+
+# Starting equipment specialized per class, built once from the class table
+_SHIELD_CLASSES = frozenset({"Fighter", "Cleric"})
+_CLASS_WEAPON = {"Fighter": "Longsword"}  # everyone else starts with a dagger
+_CLASS_EQUIPMENT = {
+    cls: {
+        "armor": "Leather Armor",
+        "weapon": _CLASS_WEAPON.get(cls, "Dagger"),
+        "shield": "Shield" if cls in _SHIELD_CLASSES else None,
+    }
+    for cls in CLASSES
+}
+
+# Fixed Prompt.ask choice lists, shared across redraw loops
+_MAIN_CHOICES = ["1", "2", "3", "4", "5"]
+_STAT_METHOD_CHOICES = ["1", "2", "3", "4", "back"]
+_SETTINGS_CHOICES = ["1", "2", "3", "4", "5", "6", "7"]
 
 
 class MenuChoice(Enum):
@@ -33,42 +140,172 @@ class MenuChoice(Enum):
     QUIT = "quit"
 
 
+# Shared screen headers — top spacing plus a centered title — reused by
+# every character-creation frame instead of rebuilt per screen
+_CREATION_HEADER = (Text("\n\n"), Align.center(_DND_TITLE_TEXT), Text(""))
+_ROLL_HEADER = Group(Text("\n\n"),
+                     Align.center(Text("ROLLING YOUR DESTINY", style=Colors.TITLE)),
+                     Text(""))
+_HERO_HEADER = Group(Text("\n\n"),
+                     Align.center(Text("YOUR HERO AWAITS", style=Colors.TITLE)),
+                     Text(""))
+
+
+# Menu selections indexed by int(choice) - 1; a tuple index beats a dict
+# lookup and nothing is rebuilt per selection
+_MAIN_CHOICE_TABLE = (MenuChoice.NEW_GAME, MenuChoice.LOAD_GAME,
+                      MenuChoice.SETTINGS, MenuChoice.ABOUT, MenuChoice.QUIT)
+_STAT_METHOD_TABLE = ("4d6_drop_lowest", "3d6", "array", "point_buy")
+
+
 class MenuSystem:
     """Handles all menu interactions with beautiful, professional interface."""
     
     def __init__(self, settings_manager: SettingsManager):
-        self.console = Console()
+        self.console = _CONSOLE
         self.settings_manager = settings_manager
         self.running = True
+
+        # Windows consoles need VT processing enabled once so the raw ANSI
+        # clear/home sequences used by the menus work without shelling out
+        if os.name == 'nt':
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+                mode = ctypes.c_uint32()
+                if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                    # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                    kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+            except (OSError, AttributeError):
+                pass  # legacy console; Rich falls back to its own handling
+
+        # Block-buffer stdout so Rich's many small writes coalesce into one
+        # syscall per flush; frames flush explicitly after each render
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        except (AttributeError, ValueError, OSError):
+            pass  # non-standard stdout (pipe, test harness); leave it alone
+
+        # Static menu renderables, built lazily on first use and reused
+        # across redraws
+        self._title_panel = None
+        self._main_menu_panel = None
+        self._about_panel = None
+        self._farewell_panel = None
+        self._settings_options_panel = None
+
+        # Character-creation panels are static too: (intro, options) pairs
+        self._char_name_panel = None
+        self._stat_method_panels = None
+        self._race_panels = None
+        self._class_panels = None
+        self._bg_panels = None
+
+        # Fully static screens pre-rendered to ANSI bytes on first show
+        self._about_ansi = None
+        self._farewell_ansi = None
+
+        # Last frame emitted by _render_screen, used to skip identical
+        # repaints, and the row where that frame left the cursor
+        self._last_frame = None
+        self._last_frame_rows = 0
+
+        # Pending settings status panel: (panel, expires_at monotonic time)
+        self._flash_message = None
+
+        # Save listing cache: (saves_dir, dir_mtime, save_files)
+        self._save_cache = None
+        # Formatted display names keyed on save filename
+        self._display_name_cache: Dict[str, str] = {}
     
+    @cached_property
+    def _roller(self) -> "DiceRoller":
+        """DiceRoller built on first character creation, not at menu startup."""
+        from dice_system import DiceRoller
+        return DiceRoller(self.console)
+
+    def _press_any_key(self):
+        """Wait for one raw keypress, skipping Rich's prompt machinery."""
+        self.console.print(Text("Press any key to continue...", style=Colors.MUTED))
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.getch()
+        else:
+            import termios
+            import tty
+            try:
+                fd = sys.stdin.fileno()
+                old_attrs = termios.tcgetattr(fd)
+            except (termios.error, ValueError, OSError):
+                sys.stdin.readline()  # not a tty; fall back to line input
+                return
+            try:
+                tty.setraw(fd)
+                sys.stdin.read(1)
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
     def clear_screen(self):
-        """Clear the terminal screen properly."""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
-        self.console.clear()
-    
+        """Clear the terminal and scrollback with one ANSI write (no subprocess)."""
+        self.console.file.write("\x1b[2J\x1b[3J\x1b[H")
+        self.console.file.flush()
+        self._last_frame = None
+
+    def _cursor_home(self):
+        """Home the cursor and clear forward, cheaper than a full screen clear."""
+        self.console.file.write("\x1b[H\x1b[0J")
+        self.console.file.flush()
+        self._last_frame = None
+
+    def _render_screen(self, *renderables):
+        """Render a whole screen in one write, skipping unchanged repaints.
+
+        The frame is captured to a string first; if it matches the last frame
+        emitted, the frame itself is not rewritten — the cursor is parked
+        below it (where a full repaint would leave it) and anything under
+        that, like a stale prompt line, is erased.
+        """
+        with self.console.capture() as capture:
+            self.console.print(Group(*renderables))
+        frame = capture.get()
+        out = self.console.file
+        if frame == self._last_frame:
+            out.write(f"\x1b[{self._last_frame_rows};1H\x1b[0J")
+        else:
+            # One write(), bracketed by DEC mode 2026 (synchronized output)
+            # so supporting terminals paint the frame atomically without
+            # tearing; terminals that don't support it ignore the escapes
+            out.write("\x1b[?2026h\x1b[2J\x1b[H" + frame + "\x1b[?2026l")
+            self._last_frame = frame
+            self._last_frame_rows = frame.count("\n") + 1
+        out.flush()
+
+    def _title_parts(self):
+        """Renderables for the title header: top spacing, panel, blank line."""
+        if self._title_panel is None:
+            # Use Rich Group and Align to center each line
+            title_lines = Group(
+                _centered("DUNGEONS & DAEMONS", Colors.TITLE),
+                _centered("An AI-Powered Adventure Awaits", Colors.TITLE)
+            )
+            self._title_panel = Panel(
+                title_lines,
+                style=Colors.TITLE,
+                border_style=Colors.ACCENT,
+                padding=(2, 4),
+                width=65
+            )
+        return (Text("\n"), Align.center(self._title_panel), Text(""))
+
     def show_title(self):
         """Display the clean game title."""
-        # Add some spacing at the top for better visual balance
-        self.console.print("\n" * 2)
-
-        # Use Rich Group and Align to center each line
-        title_lines = Group(
-            Align.center(Text("DUNGEONS & DAEMONS", style=Colors.TITLE)),
-            Align.center(Text("An AI-Powered Adventure Awaits", style=Colors.TITLE))
-        )
-        title_panel = Panel(
-            title_lines,
-            style=Colors.TITLE,
-            border_style=Colors.ACCENT,
-            padding=(2, 4),
-            width=65
-        )
-        self.console.print(Align.center(title_panel))
-        self.console.print()
+        self._render_screen(*self._title_parts())
     
     def animated_loading(self, duration: float = 2.0):
         """Show an elegant animated loading sequence."""
+        from rich.live import Live
+
         messages = [
             "Awakening the ancient spirits...",
             "Consulting the mystical archives...",
@@ -76,28 +313,27 @@ class MenuSystem:
             "Magic flows through the realm...",
             "Your adventure begins now!"
         ]
-        
-        for i, message in enumerate(messages):
-            loading_panel = Panel(
+        # Build every frame up front; Live updates one region in place
+        # instead of clearing and repainting the screen per message
+        panels = [
+            Align.center(Panel(
                 Text(message, justify="center", style=Colors.INFO),
                 style=Colors.ACCENT,
                 border_style=Colors.ACCENT,
                 padding=(0, 2)
-            )
-            self.console.print(Align.center(loading_panel))
-            time.sleep(duration / len(messages))
-            if i < len(messages) - 1:
-                self.console.clear()
-                # Re-show title for context
-                title_text = Text(SIMPLE_TITLE, style=Colors.TITLE)
-                self.console.print(Align.center(title_text))
-                self.console.print()
+            ))
+            for message in messages
+        ]
+        step = duration / len(panels)
+        with Live(panels[0], console=self.console, transient=True) as live:
+            time.sleep(step)
+            for panel in panels[1:]:
+                live.update(panel)
+                time.sleep(step)
     
     def show_main_menu(self) -> MenuChoice:
         """Display the clean main menu with all text centered."""
-        while True:
-            self.clear_screen()
-            self.show_title()
+        if self._main_menu_panel is None:
             menu_options = [
                 ("1", "[New]", "New Adventure", "Begin your legendary quest"),
                 ("2", "[Load]", "Continue Journey", "Resume your saved game"),
@@ -112,12 +348,12 @@ class MenuSystem:
             menu_table.add_column(justify="center", width=30)
             for num, prefix, title, desc in menu_options:
                 menu_table.add_row(
-                    Align.center(Text(f"[{num}]", style=Colors.SELECTED)),
-                    Align.center(Text(prefix, style=Colors.ACCENT)),
-                    Align.center(Text(title, style=Colors.MENU_OPTION)),
-                    Align.center(Text(desc, style=Colors.MUTED))
+                    _centered(f"[{num}]", Colors.SELECTED),
+                    _centered(prefix, Colors.ACCENT),
+                    _centered(title, Colors.MENU_OPTION),
+                    _centered(desc, Colors.MUTED)
                 )
-            menu_panel = Panel(
+            self._main_menu_panel = Panel(
                 menu_table,
                 title="Main Menu",
                 title_align="center",
@@ -126,46 +362,26 @@ class MenuSystem:
                 padding=(2, 3),
                 width=75
             )
-            self.console.print(Align.center(menu_panel))
-            self.console.print("\n")
-            prompt_text = Text()
-            prompt_text.append("Choose your path", style=Colors.INFO)
-            prompt_text.append(" (1-5)", style=Colors.MUTED)
+        while True:
+            self._render_screen(*self._title_parts(),
+                                Align.center(self._main_menu_panel), Text("\n"))
             try:
                 choice = Prompt.ask(
-                    prompt_text,
-                    choices=["1", "2", "3", "4", "5"],
+                    _MAIN_MENU_PROMPT,
+                    choices=_MAIN_CHOICES,
                     default="1",
                     show_choices=False
                 )
-                
-                # Clear screen after menu input
-                import os
-                os.system('cls' if os.name == 'nt' else 'clear')
-                self.console.clear()
-                
-                choice_map = {
-                    "1": MenuChoice.NEW_GAME,
-                    "2": MenuChoice.LOAD_GAME,
-                    "3": MenuChoice.SETTINGS,
-                    "4": MenuChoice.ABOUT,
-                    "5": MenuChoice.QUIT
-                }
-                return choice_map[choice]
+
+                # No clear here: every destination screen paints (or clears)
+                # itself first, so wiping now would just double the work
+                return _MAIN_CHOICE_TABLE[int(choice) - 1]
             except KeyboardInterrupt:
                 return MenuChoice.QUIT
     
     def show_character_creation(self) -> Optional[Dict[str, Any]]:
         """Handle comprehensive D&D character creation with dice rolling."""
-        from character_data import (
-            get_race_choices, get_class_choices, get_background_choices,
-            RACES, CLASSES, BACKGROUNDS,
-            apply_racial_bonuses, get_racial_proficiencies,
-            get_class_proficiencies, get_background_proficiencies,
-            calculate_starting_hp, calculate_armor_class
-        )
-        
-        roller = DiceRoller(self.console)
+        roller = self._roller
         character_data = {}
         
         # Step 1: Character Name
@@ -220,13 +436,7 @@ class MenuSystem:
     
     def _get_character_name(self) -> Optional[str]:
         """Get character name from player."""
-        while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
+        if self._char_name_panel is None:
             char_lines = [
                 "CHARACTER CREATION",
                 "",
@@ -235,8 +445,8 @@ class MenuSystem:
                 "What name shall be whispered in taverns",
                 "and carved upon monuments?"
             ]
-            char_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in char_lines])
-            char_panel = Panel(
+            char_group = _centered_block(char_lines, Colors.ACCENT)
+            self._char_name_panel = Panel(
                 char_group,
                 title="Creating Your Legend",
                 title_align="center",
@@ -245,41 +455,39 @@ class MenuSystem:
                 padding=(2, 4),
                 width=80
             )
-            self.console.print(Align.center(char_panel))
-            self.console.print()
-            
-            name_prompt = Text()
-            name_prompt.append("Enter your hero's name", style=Colors.INFO)
-            name_prompt.append(" (or 'back' to return)", style=Colors.MUTED)
-            
-            name = Prompt.ask(name_prompt, default="").strip()
-            
+
+        # The static frame goes up once; retries only re-prompt beneath it
+        self._render_screen(
+            *_CREATION_HEADER,
+            Align.center(self._char_name_panel), Text("")
+        )
+
+        error_shown = False
+        while True:
+            name = Prompt.ask(_NAME_PROMPT, default="").strip()
+
             if name.lower() == 'back':
                 return None
-            
-            if name and len(name) <= 20 and name.replace(" ", "").replace("'", "").isalpha():
+
+            if _NAME_RE.match(name):
                 return name
-            
-            # Show error
-            self.console.print()
-            error_panel = Panel(
-                Align.center(Text("Name must be 1-20 characters and contain only letters", style=Colors.ERROR)),
-                style=Colors.ERROR,
-                border_style=Colors.ERROR,
-                width=60
-            )
-            self.console.print(Align.center(error_panel))
-            time.sleep(2)
+
+            # Show the error inline and re-prompt immediately; no screen
+            # wipe, no sleep — the message stays visible until the next entry
+            if not error_shown:
+                error_panel = Panel(
+                    _centered("Name must be 1-20 letters (spaces, ' and - allowed)", Colors.ERROR),
+                    style=Colors.ERROR,
+                    border_style=Colors.ERROR,
+                    width=60
+                )
+                self.console.print(Align.center(error_panel))
+                self._last_frame = None
+                error_shown = True
     
     def _choose_stat_method(self) -> Optional[str]:
         """Choose method for determining ability scores."""
-        while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
+        if self._stat_method_panels is None:
             method_lines = [
                 "ABILITY SCORE GENERATION",
                 "",
@@ -287,7 +495,7 @@ class MenuSystem:
                 "",
                 "How shall the fates determine your abilities?"
             ]
-            method_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in method_lines])
+            method_group = _centered_block(method_lines, Colors.ACCENT)
             method_panel = Panel(
                 method_group,
                 title="Rolling the Dice of Destiny",
@@ -297,9 +505,7 @@ class MenuSystem:
                 padding=(2, 4),
                 width=80
             )
-            self.console.print(Align.center(method_panel))
-            self.console.print()
-            
+
             # Show options
             methods_table = Table.grid(padding=(0, 2))
             methods_table.add_column(justify="center", width=6)
@@ -329,31 +535,25 @@ class MenuSystem:
                 padding=(1, 2),
                 width=80
             )
-            self.console.print(Align.center(methods_panel))
-            self.console.print()
-            
-            choice_prompt = Text()
-            choice_prompt.append("Choose method", style=Colors.INFO)
-            choice_prompt.append(" (1-4, or 'back')", style=Colors.MUTED)
-            
-            choice = Prompt.ask(choice_prompt, choices=["1", "2", "3", "4", "back"], default="1")
+            self._stat_method_panels = (method_panel, methods_panel)
+
+        intro_panel, options_panel = self._stat_method_panels
+        while True:
+            self._render_screen(
+                *_CREATION_HEADER,
+                Align.center(intro_panel), Text(""),
+                Align.center(options_panel), Text("")
+            )
+
+            choice = Prompt.ask(_STAT_METHOD_PROMPT, choices=_STAT_METHOD_CHOICES, default="1")
             
             if choice == "back":
                 return None
-            
-            method_map = {
-                "1": "4d6_drop_lowest",
-                "2": "3d6",
-                "3": "array",
-                "4": "point_buy"
-            }
-            
-            return method_map[choice]
+
+            return _STAT_METHOD_TABLE[int(choice) - 1]
     
-    def _roll_ability_scores(self, roller: DiceRoller, method: str) -> Optional[Dict[str, int]]:
+    def _roll_ability_scores(self, roller: "DiceRoller", method: str) -> Optional[Dict[str, int]]:
         """Roll ability scores using chosen method."""
-        import time
-        
         if method == "array":
             return self._assign_standard_array()
         elif method == "point_buy":
@@ -361,36 +561,34 @@ class MenuSystem:
         else:
             return self._roll_stats_with_dice(roller, method)
     
-    def _roll_stats_with_dice(self, roller: DiceRoller, method: str) -> Optional[Dict[str, int]]:
+    def _roll_stats_with_dice(self, roller: "DiceRoller", method: str) -> Optional[Dict[str, int]]:
         """Roll stats with dice animation."""
-        import time
         stats = {}
         stat_names = ["Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma"]
         
-        for stat_name in stat_names:
+        drop_lowest = method == "4d6_drop_lowest"
+        dice_per_stat = 4 if drop_lowest else 3
+
+        # One bulk draw covers every die for every stat, instead of one
+        # roll_dice call (and DiceResult allocation) per individual d6
+        all_rolls = random.choices(range(1, 7), k=dice_per_stat * len(stat_names))
+
+        for i, stat_name in enumerate(stat_names):
             self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("ROLLING YOUR DESTINY", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
-            # Roll the dice
-            if method == "4d6_drop_lowest":
-                rolls = [roller.roll_dice(1, 6).rolls[0] for _ in range(4)]
-                sorted_rolls = sorted(rolls, reverse=True)
-                final_value = sum(sorted_rolls[:3])
-                roller.display_stat_roll(stat_name, rolls, final_value)
+            self.console.print(_ROLL_HEADER)
+
+            rolls = all_rolls[i * dice_per_stat:(i + 1) * dice_per_stat]
+            if drop_lowest:
+                # Branch-free drop-lowest: no sort needed
+                final_value = sum(rolls) - min(rolls)
             else:  # 3d6
-                rolls = [roller.roll_dice(1, 6).rolls[0] for _ in range(3)]
                 final_value = sum(rolls)
-                roller.display_stat_roll(stat_name, rolls, final_value)
-            
+            roller.display_stat_roll(stat_name, rolls, final_value)
+
             stats[stat_name] = final_value
             
             self.console.print()
-            continue_prompt = Text()
-            continue_prompt.append("Press Enter to continue...", style=Colors.MUTED)
-            Prompt.ask(continue_prompt, default="")
+            self._press_any_key()
         
         return stats
     
@@ -419,15 +617,8 @@ class MenuSystem:
     
     def _choose_race(self) -> Optional[str]:
         """Choose character race."""
-        from character_data import RACES, get_race_choices
-        
-        while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
+        race_choices = get_race_choices()
+        if self._race_panels is None:
             race_lines = [
                 "CHOOSE YOUR HERITAGE",
                 "",
@@ -435,7 +626,7 @@ class MenuSystem:
                 "",
                 "From what lineage do you descend?"
             ]
-            race_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in race_lines])
+            race_group = _centered_block(race_lines, Colors.ACCENT)
             race_panel = Panel(
                 race_group,
                 title="Bloodlines and Ancestry",
@@ -445,16 +636,12 @@ class MenuSystem:
                 padding=(2, 4),
                 width=70
             )
-            self.console.print(Align.center(race_panel))
-            self.console.print()
-            
             # Show race options
             races_table = Table.grid(padding=(0, 2))
             races_table.add_column(justify="center", width=6)
             races_table.add_column(justify="left", width=15)
             races_table.add_column(justify="left", width=45)
             
-            race_choices = get_race_choices()
             for i, race_name in enumerate(race_choices, 1):
                 race = RACES[race_name]
                 races_table.add_row(
@@ -472,14 +659,18 @@ class MenuSystem:
                 padding=(1, 2),
                 width=80
             )
-            self.console.print(Align.center(races_panel))
-            self.console.print()
-            
-            choice_prompt = Text()
-            choice_prompt.append("Choose race", style=Colors.INFO)
-            choice_prompt.append(f" (1-{len(race_choices)}, or 'back')", style=Colors.MUTED)
-            
+            choice_prompt = Text.assemble(("Choose race", Colors.INFO), (f" (1-{len(race_choices)}, or 'back')", Colors.MUTED))
             valid_choices = [str(i) for i in range(1, len(race_choices) + 1)] + ["back"]
+            self._race_panels = (race_panel, races_panel, choice_prompt, valid_choices)
+
+        intro_panel, options_panel, choice_prompt, valid_choices = self._race_panels
+        while True:
+            self._render_screen(
+                *_CREATION_HEADER,
+                Align.center(intro_panel), Text(""),
+                Align.center(options_panel), Text("")
+            )
+
             choice = Prompt.ask(choice_prompt, choices=valid_choices, default="1")
             
             if choice == "back":
@@ -489,15 +680,8 @@ class MenuSystem:
     
     def _choose_class(self) -> Optional[str]:
         """Choose character class."""
-        from character_data import CLASSES, get_class_choices
-        
-        while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
+        class_choices = get_class_choices()
+        if self._class_panels is None:
             class_lines = [
                 "CHOOSE YOUR PATH",
                 "",
@@ -505,7 +689,7 @@ class MenuSystem:
                 "",
                 "What calling speaks to your soul?"
             ]
-            class_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in class_lines])
+            class_group = _centered_block(class_lines, Colors.ACCENT)
             class_panel = Panel(
                 class_group,
                 title="Paths of Power",
@@ -515,16 +699,12 @@ class MenuSystem:
                 padding=(2, 4),
                 width=70
             )
-            self.console.print(Align.center(class_panel))
-            self.console.print()
-            
             # Show class options
             classes_table = Table.grid(padding=(0, 2))
             classes_table.add_column(justify="center", width=6)
             classes_table.add_column(justify="left", width=15)
             classes_table.add_column(justify="left", width=45)
             
-            class_choices = get_class_choices()
             for i, class_name in enumerate(class_choices, 1):
                 char_class = CLASSES[class_name]
                 classes_table.add_row(
@@ -542,14 +722,18 @@ class MenuSystem:
                 padding=(1, 2),
                 width=80
             )
-            self.console.print(Align.center(classes_panel))
-            self.console.print()
-            
-            choice_prompt = Text()
-            choice_prompt.append("Choose class", style=Colors.INFO)
-            choice_prompt.append(f" (1-{len(class_choices)}, or 'back')", style=Colors.MUTED)
-            
+            choice_prompt = Text.assemble(("Choose class", Colors.INFO), (f" (1-{len(class_choices)}, or 'back')", Colors.MUTED))
             valid_choices = [str(i) for i in range(1, len(class_choices) + 1)] + ["back"]
+            self._class_panels = (class_panel, classes_panel, choice_prompt, valid_choices)
+
+        intro_panel, options_panel, choice_prompt, valid_choices = self._class_panels
+        while True:
+            self._render_screen(
+                *_CREATION_HEADER,
+                Align.center(intro_panel), Text(""),
+                Align.center(options_panel), Text("")
+            )
+
             choice = Prompt.ask(choice_prompt, choices=valid_choices, default="1")
             
             if choice == "back":
@@ -559,15 +743,8 @@ class MenuSystem:
     
     def _choose_background(self) -> Optional[str]:
         """Choose character background."""
-        from character_data import BACKGROUNDS, get_background_choices
-        
-        while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text("DUNGEONS & DAEMONS", style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            
+        bg_choices = get_background_choices()
+        if self._bg_panels is None:
             bg_lines = [
                 "YOUR PAST SHAPES YOU",
                 "",
@@ -575,7 +752,7 @@ class MenuSystem:
                 "",
                 "What did you do before adventure called?"
             ]
-            bg_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in bg_lines])
+            bg_group = _centered_block(bg_lines, Colors.ACCENT)
             bg_panel = Panel(
                 bg_group,
                 title="Life Before Adventure",
@@ -585,16 +762,12 @@ class MenuSystem:
                 padding=(2, 4),
                 width=70
             )
-            self.console.print(Align.center(bg_panel))
-            self.console.print()
-            
             # Show background options
             bg_table = Table.grid(padding=(0, 2))
             bg_table.add_column(justify="center", width=6)
             bg_table.add_column(justify="left", width=15)
             bg_table.add_column(justify="left", width=45)
             
-            bg_choices = get_background_choices()
             for i, bg_name in enumerate(bg_choices, 1):
                 background = BACKGROUNDS[bg_name]
                 bg_table.add_row(
@@ -603,7 +776,7 @@ class MenuSystem:
                     Text(background.description[:50] + "...", style=Colors.MUTED)
                 )
             
-            bg_panel = Panel(
+            bgs_panel = Panel(
                 bg_table,
                 title="Available Backgrounds",
                 title_align="center",
@@ -612,14 +785,18 @@ class MenuSystem:
                 padding=(1, 2),
                 width=80
             )
-            self.console.print(Align.center(bg_panel))
-            self.console.print()
-            
-            choice_prompt = Text()
-            choice_prompt.append("Choose background", style=Colors.INFO)
-            choice_prompt.append(f" (1-{len(bg_choices)}, or 'back')", style=Colors.MUTED)
-            
+            choice_prompt = Text.assemble(("Choose background", Colors.INFO), (f" (1-{len(bg_choices)}, or 'back')", Colors.MUTED))
             valid_choices = [str(i) for i in range(1, len(bg_choices) + 1)] + ["back"]
+            self._bg_panels = (bg_panel, bgs_panel, choice_prompt, valid_choices)
+
+        intro_panel, options_panel, choice_prompt, valid_choices = self._bg_panels
+        while True:
+            self._render_screen(
+                *_CREATION_HEADER,
+                Align.center(intro_panel), Text(""),
+                Align.center(options_panel), Text("")
+            )
+
             choice = Prompt.ask(choice_prompt, choices=valid_choices, default="1")
             
             if choice == "back":
@@ -627,17 +804,11 @@ class MenuSystem:
             
             return bg_choices[int(choice) - 1]
     
-    def _finalize_character(self, character_data: Dict[str, Any], roller: DiceRoller) -> Dict[str, Any]:
+    def _finalize_character(self, character_data: Dict[str, Any], roller: "DiceRoller") -> Dict[str, Any]:
         """Finalize character with calculated stats and equipment."""
-        from character_data import (
-            CLASSES, RACES, BACKGROUNDS,
-            get_class_proficiencies, get_background_proficiencies,
-            calculate_starting_hp, calculate_armor_class
-        )
-        
         # Calculate derived stats
-        con_modifier = (character_data["constitution"] - 10) // 2
-        dex_modifier = (character_data["dexterity"] - 10) // 2
+        con_modifier = ABILITY_MODIFIERS[character_data["constitution"]]
+        dex_modifier = ABILITY_MODIFIERS[character_data["dexterity"]]
         
         # Hit points
         char_class = CLASSES[character_data["character_class"]]
@@ -654,15 +825,13 @@ class MenuSystem:
         race = RACES[character_data["race"]]
         background = BACKGROUNDS[character_data["background"]]
         
-        inventory = ["Backpack", "Bedroll", "Rations (5 days)"]
-        inventory.extend(background.equipment[:3])  # Add some background equipment
+        # Single chained pass: no intermediate slice list, no extend copy
+        inventory = list(chain(_BASE_INVENTORY, islice(background.equipment, 3)))
         
-        equipment = {
-            "armor": "Leather Armor",
-            "weapon": "Longsword" if character_data["character_class"] == "Fighter" else "Dagger",
-            "shield": "Shield" if character_data["character_class"] in ["Fighter", "Cleric"] else None,
-            "tools": []
-        }
+        # Copy the precomputed per-class entry; tools stays a fresh list so
+        # later mutation never leaks into the shared table
+        equipment = dict(_CLASS_EQUIPMENT[character_data["character_class"]])
+        equipment["tools"] = []
         
         return {
             "level": 1,
@@ -670,7 +839,8 @@ class MenuSystem:
             "max_hp": max_hp,
             "armor_class": armor_class + 1,  # +1 for leather armor
             "proficiency_bonus": 2,
-            "skill_proficiencies": class_profs.get("skills", [])[:2] + bg_profs.get("skills", []),
+            "skill_proficiencies": list(chain(islice(class_profs.get("skills", ()), 2),
+                                              bg_profs.get("skills", ()))),
             "saving_throw_proficiencies": class_profs.get("saving_throws", []),
             "inventory": inventory,
             "equipment": equipment,
@@ -682,27 +852,21 @@ class MenuSystem:
     def _show_final_character_sheet(self, character_data: Dict[str, Any]) -> bool:
         """Show final character sheet for confirmation."""
         self.clear_screen()
-        self.console.print("\n" * 2)
-        title_text = Text("YOUR HERO AWAITS", style=Colors.TITLE)
-        self.console.print(Align.center(title_text))
-        self.console.print()
+        self.console.print(_HERO_HEADER)
         
-        # Character summary
-        summary_lines = [
-            f"Name: {character_data['name']}",
-            f"Race: {character_data['race']} | Class: {character_data['character_class']}",
-            f"Background: {character_data['background']} | Level: {character_data['level']}",
-            "",
-            f"STR: {character_data['strength']} | DEX: {character_data['dexterity']} | CON: {character_data['constitution']}",
-            f"INT: {character_data['intelligence']} | WIS: {character_data['wisdom']} | CHA: {character_data['charisma']}",
-            "",
-            f"HP: {character_data['hp']}/{character_data['max_hp']} | AC: {character_data['armor_class']}",
-            f"Gold: {character_data['gold_pieces']} GP"
-        ]
-        
-        summary_group = Group(*[Align.center(Text(line, style=Colors.INFO)) for line in summary_lines])
+        # Character summary: one f-string, one Text — no per-line wrappers
+        c = character_data
+        body = (
+            f"Name: {c['name']}\n"
+            f"Race: {c['race']} | Class: {c['character_class']}\n"
+            f"Background: {c['background']} | Level: {c['level']}\n\n"
+            f"STR: {c['strength']} | DEX: {c['dexterity']} | CON: {c['constitution']}\n"
+            f"INT: {c['intelligence']} | WIS: {c['wisdom']} | CHA: {c['charisma']}\n\n"
+            f"HP: {c['hp']}/{c['max_hp']} | AC: {c['armor_class']}\n"
+            f"Gold: {c['gold_pieces']} GP"
+        )
         summary_panel = Panel(
-            summary_group,
+            Text(body, justify="center", style=Colors.INFO),
             title="Your Complete Character",
             title_align="center",
             style=Colors.SUCCESS,
@@ -713,36 +877,48 @@ class MenuSystem:
         self.console.print(Align.center(summary_panel))
         self.console.print()
         
-        confirm_prompt = Text()
-        confirm_prompt.append("Begin your legendary adventure?", style=Colors.INFO)
-        
-        return Confirm.ask(confirm_prompt, default=True)
+        return Confirm.ask(_BEGIN_ADVENTURE_PROMPT, default=True)
     
+    def _get_save_files(self, saves_dir: str) -> List[tuple]:
+        """List save files as (name, path, mtime) tuples, newest first.
+
+        A single scandir pass reuses the stat results the directory walk
+        already fetched, and the whole listing is cached until the save
+        directory's own mtime changes.
+        """
+        try:
+            dir_mtime = os.stat(saves_dir).st_mtime
+        except OSError:
+            return []
+        if self._save_cache and self._save_cache[:2] == (saves_dir, dir_mtime):
+            return self._save_cache[2]
+        save_files = []
+        try:
+            with os.scandir(saves_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        try:
+                            save_files.append((entry.name, entry.path, entry.stat().st_mtime))
+                        except OSError:
+                            continue
+        except FileNotFoundError:
+            return []
+        save_files.sort(key=operator.itemgetter(2), reverse=True)
+        self._save_cache = (saves_dir, dir_mtime, save_files)
+        return save_files
+
     def show_load_menu(self) -> Optional[str]:
         """Show clean load game menu with centered text."""
-        self.clear_screen()
-        self.console.print("\n" * 2)
-        title_text = Text(SIMPLE_TITLE, style=Colors.TITLE)
-        self.console.print(Align.center(title_text))
-        self.console.print()
+        title_text = _SIMPLE_TITLE_TEXT
+        parts = [Text("\n"), Align.center(title_text), Text("")]
         saves_dir = self.settings_manager.settings.save_directory
-        save_files = []
-        if os.path.exists(saves_dir):
-            for file in os.listdir(saves_dir):
-                if file.endswith('.json'):
-                    full_path = os.path.join(saves_dir, file)
-                    try:
-                        mtime = os.path.getmtime(full_path)
-                        save_files.append((file, full_path, mtime))
-                    except OSError:
-                        continue
-            save_files.sort(key=lambda x: x[2], reverse=True)
+        save_files = self._get_save_files(saves_dir)
         if not save_files:
             no_saves_lines = [
                 "No saved adventures found.",
                 "Start a new quest to begin your legend!"
             ]
-            no_saves_group = Group(*[Align.center(Text(line, style=Colors.WARNING)) for line in no_saves_lines])
+            no_saves_group = _centered_block(no_saves_lines, Colors.WARNING)
             no_saves_panel = Panel(
                 no_saves_group,
                 title="Saved Adventures",
@@ -752,8 +928,8 @@ class MenuSystem:
                 padding=(3, 5),
                 width=65
             )
-            self.console.print(Align.center(no_saves_panel))
-            self.console.print()
+            parts.extend((Align.center(no_saves_panel), Text("")))
+            self._render_screen(*parts)
             Prompt.ask("\nPress Enter to return to menu...")
             return None
         save_table = Table(show_header=True, header_style=Colors.MENU_TITLE)
@@ -761,12 +937,15 @@ class MenuSystem:
         save_table.add_column("Adventure", justify="center", width=25)
         save_table.add_column("Last Played", justify="center", width=20)
         for i, (filename, filepath, mtime) in enumerate(save_files[:10], 1):
-            display_name = filename.replace('_save.json', '').replace('_', ' ').title()
-            modified_time = time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
+            display_name = self._display_name_cache.get(filename)
+            if display_name is None:
+                display_name = filename.removesuffix('_save.json').translate(_NAME_TRANS).title()
+                self._display_name_cache[filename] = display_name
+            modified_time = _format_mtime_minute(int(mtime // 60))
             save_table.add_row(
-                Align.center(Text(f"[{i}]", style=Colors.SELECTED)),
-                Align.center(Text(display_name, style=Colors.INFO)),
-                Align.center(Text(modified_time, style=Colors.MUTED))
+                _centered(f"[{i}]", Colors.SELECTED),
+                _centered(display_name, Colors.INFO),
+                _centered(modified_time, Colors.MUTED)
             )
         saves_panel = Panel(
             save_table,
@@ -777,94 +956,104 @@ class MenuSystem:
             padding=(2, 3),
             width=75
         )
-        self.console.print(Align.center(saves_panel))
-        self.console.print()
-        load_prompt = Text()
-        load_prompt.append("Select adventure slot", style=Colors.INFO)
-        load_prompt.append(" (or 'back' to return)", style=Colors.MUTED)
-        try:
-            choice = Prompt.ask(load_prompt, default="back")
-            if choice.lower() == 'back':
+        parts.extend((Align.center(saves_panel), Text("")))
+        self._render_screen(*parts)
+        # Loop on invalid slots instead of recursing, reusing the scanned
+        # save list and the already-rendered panel
+        error_shown = False
+        while True:
+            try:
+                choice = Prompt.ask(_LOAD_SLOT_PROMPT, default="back")
+                if choice.lower() == 'back':
+                    return None
+                slot_num = int(choice)
+            except (ValueError, KeyboardInterrupt):
                 return None
-            slot_num = int(choice)
             if 1 <= slot_num <= len(save_files):
                 return save_files[slot_num - 1][1]
-            else:
+            if not error_shown:
+                # Error stays on screen while the prompt re-asks; no sleep,
+                # and the extra print means the differ must repaint next time
                 error_panel = Panel(
-                    Align.center(Text("Invalid slot number! Please try again.", style=Colors.ERROR)),
+                    _centered("Invalid slot number! Please try again.", Colors.ERROR),
                     style=Colors.ERROR,
                     border_style=Colors.ERROR
                 )
                 self.console.print(error_panel)
-                time.sleep(1)
-                return self.show_load_menu()
-        except (ValueError, KeyboardInterrupt):
-            return None
+                self._last_frame = None
+                error_shown = True
     
+    def _flash(self, message: str, style: str, seconds: float = 2.0):
+        """Queue a status panel for the next settings render instead of
+        blocking the UI with a sleep."""
+        panel = Panel(message, style=style, border_style=style)
+        self._flash_message = (panel, time.monotonic() + seconds)
+
+    def _build_settings_panel(self) -> Panel:
+        """Current-values settings panel, cached per value combination."""
+        s = self.settings_manager.settings
+        return _settings_panel_for(s.ai_model, s.ai_temperature, s.save_directory,
+                                   s.max_history_turns, s.auto_save,
+                                   s.show_debug_info, s.animation_speed,
+                                   s.ollama_host, s.ollama_port)
+
+    @staticmethod
+    def _build_settings_options_panel() -> Panel:
+        """Build the static configuration-options panel."""
+        options_table = Table.grid(padding=(0, 2))
+        options_table.add_column(justify="center", width=6)
+        options_table.add_column(justify="center", width=25)
+        options = [
+            ("1", "Change AI Model"),
+            ("2", "Adjust Temperature"),
+            ("3", "Set Save Directory"),
+            ("4", "Configure History Length"),
+            ("5", "Toggle Auto Save"),
+            ("6", "Toggle Debug Mode"),
+            ("7", "Back to Main Menu")
+        ]
+        for num, option in options:
+            options_table.add_row(
+                _centered(f"[{num}]", Colors.SELECTED),
+                _centered(option, Colors.MENU_OPTION)
+            )
+        return Panel(
+            options_table,
+            title="Configuration Options",
+            title_align="center",
+            style=Colors.ACCENT,
+            border_style=Colors.ACCENT,
+            padding=(2, 3),
+            width=60
+        )
+
     def show_settings_menu(self):
         """Show clean settings menu with centered text."""
+        if self._settings_options_panel is None:
+            self._settings_options_panel = self._build_settings_options_panel()
+        # Everything except the live values panel is identical every frame;
+        # build those renderables once and reuse them across iterations
+        header = (Text("\n"), Align.center(_SIMPLE_TITLE_TEXT), Text(""))
+        options_part = Align.center(self._settings_options_panel)
+        spacer = Text("")
+        settings_part = None
+        dirty = True  # rebuild the live panel only after a setting changes
         while True:
-            self.clear_screen()
-            self.console.print("\n" * 2)
-            title_text = Text(SIMPLE_TITLE, style=Colors.TITLE)
-            self.console.print(Align.center(title_text))
-            self.console.print()
-            settings_lines = [
-                f"AI Model: {self.settings_manager.settings.ai_model}",
-                f"Temperature: {self.settings_manager.settings.ai_temperature}",
-                f"Save Directory: {self.settings_manager.settings.save_directory}",
-                f"Max History: {self.settings_manager.settings.max_history_turns} turns",
-                f"Auto Save: {'[Enabled]' if self.settings_manager.settings.auto_save else '[Disabled]'}",
-                f"Debug Mode: {'[Enabled]' if self.settings_manager.settings.show_debug_info else '[Disabled]'}",
-                f"Animation Speed: {self.settings_manager.settings.animation_speed}s",
-                f"Ollama: {self.settings_manager.settings.ollama_host}:{self.settings_manager.settings.ollama_port}"
-            ]
-            settings_group = Group(*[Align.center(Text(line, style=Colors.INFO)) for line in settings_lines])
-            settings_panel = Panel(
-                settings_group,
-                title="Current Settings",
-                title_align="center",
-                style=Colors.INFO,
-                border_style=Colors.INFO,
-                padding=(2, 4),
-                width=75
-            )
-            self.console.print(Align.center(settings_panel))
-            self.console.print()
-            options_table = Table.grid(padding=(0, 2))
-            options_table.add_column(justify="center", width=6)
-            options_table.add_column(justify="center", width=25)
-            options = [
-                ("1", "Change AI Model"),
-                ("2", "Adjust Temperature"),
-                ("3", "Set Save Directory"),
-                ("4", "Configure History Length"),
-                ("5", "Toggle Auto Save"),
-                ("6", "Toggle Debug Mode"),
-                ("7", "Back to Main Menu")
-            ]
-            for num, option in options:
-                options_table.add_row(
-                    Align.center(Text(f"[{num}]", style=Colors.SELECTED)),
-                    Align.center(Text(option, style=Colors.MENU_OPTION))
-                )
-            options_panel = Panel(
-                options_table,
-                title="Configuration Options",
-                title_align="center",
-                style=Colors.ACCENT,
-                border_style=Colors.ACCENT,
-                padding=(2, 3),
-                width=60
-            )
-            self.console.print(Align.center(options_panel))
-            self.console.print()
+            if dirty:
+                settings_part = Align.center(self._build_settings_panel())
+                dirty = False
+            parts = [*header, settings_part, spacer, options_part, spacer]
+            if self._flash_message is not None:
+                flash_panel, expires_at = self._flash_message
+                if time.monotonic() < expires_at:
+                    parts.extend((Align.center(flash_panel), Text("")))
+                else:
+                    self._flash_message = None
+            self._render_screen(*parts)
             try:
-                choice_prompt = Text()
-                choice_prompt.append("Select option", style=Colors.INFO)
                 choice = Prompt.ask(
-                    choice_prompt,
-                    choices=["1", "2", "3", "4", "5", "6", "7"],
+                    _SETTINGS_PROMPT,
+                    choices=_SETTINGS_CHOICES,
                     default="7",
                     show_choices=False
                 )
@@ -882,11 +1071,14 @@ class MenuSystem:
                     self._toggle_debug_mode()
                 elif choice == "7":
                     break
+                dirty = True
             except KeyboardInterrupt:
                 break
     
-    def _change_ai_model(self):
+    def _change_ai_model(self, refresh: bool = False):
         """Change AI model with beautiful interface."""
+        if refresh:
+            self.settings_manager.invalidate_models_cache()
         available_models = self.settings_manager.get_available_models()
         current_model = self.settings_manager.settings.ai_model
         
@@ -910,42 +1102,26 @@ class MenuSystem:
         self.console.print(models_panel)
         
         try:
-            model_prompt = Text()
-            model_prompt.append("Select model number", style=Colors.INFO)
             
             choice = Prompt.ask(
-                model_prompt,
+                _MODEL_PROMPT,
                 default=str(available_models.index(current_model) + 1) if current_model in available_models else "1"
             )
             
+            if choice.strip().lower() == 'r':
+                self._change_ai_model(refresh=True)
+                return
+
             model_index = int(choice) - 1
             if 0 <= model_index < len(available_models):
                 new_model = available_models[model_index]
                 self.settings_manager.update_setting("ai_model", new_model)
-                
-                success_panel = Panel(
-                    f"AI model changed to: {new_model}",
-                    style=Colors.SUCCESS,
-                    border_style=Colors.SUCCESS
-                )
-                self.console.print(success_panel)
+                self._flash(f"AI model changed to: {new_model}", Colors.SUCCESS)
             else:
-                error_panel = Panel(
-                    "Invalid model selection!",
-                    style=Colors.ERROR,
-                    border_style=Colors.ERROR
-                )
-                self.console.print(error_panel)
-                
+                self._flash("Invalid model selection!", Colors.ERROR)
+
         except ValueError:
-            error_panel = Panel(
-                "Invalid input! Please enter a number.",
-                style=Colors.ERROR,
-                border_style=Colors.ERROR
-            )
-            self.console.print(error_panel)
-        
-        time.sleep(2)
+            self._flash("Invalid input! Please enter a number.", Colors.ERROR)
     
     def _change_ai_temperature(self):
         """Change AI temperature with validation."""
@@ -970,76 +1146,37 @@ Temperature Guide:
         self.console.print(info_panel)
         
         try:
-            temp_prompt = Text()
-            temp_prompt.append("Enter temperature (0.0-2.0)", style=Colors.INFO)
             
-            new_temp = FloatPrompt.ask(temp_prompt, default=current_temp)
+            from rich.prompt import FloatPrompt
+            new_temp = FloatPrompt.ask(_TEMPERATURE_PROMPT, default=current_temp)
             
             if 0.0 <= new_temp <= 2.0:
                 self.settings_manager.update_setting("ai_temperature", new_temp)
-                success_panel = Panel(
-                    f"AI temperature changed to: {new_temp}",
-                    style=Colors.SUCCESS,
-                    border_style=Colors.SUCCESS
-                )
-                self.console.print(success_panel)
+                self._flash(f"AI temperature changed to: {new_temp}", Colors.SUCCESS)
             else:
-                error_panel = Panel(
-                    "Temperature must be between 0.0 and 2.0!",
-                    style=Colors.ERROR,
-                    border_style=Colors.ERROR
-                )
-                self.console.print(error_panel)
-                
+                self._flash("Temperature must be between 0.0 and 2.0!", Colors.ERROR)
+
         except ValueError:
-            error_panel = Panel(
-                "Invalid temperature value!",
-                style=Colors.ERROR,
-                border_style=Colors.ERROR
-            )
-            self.console.print(error_panel)
-        
-        time.sleep(2)
+            self._flash("Invalid temperature value!", Colors.ERROR)
     
     def _change_save_directory(self):
         """Change save directory."""
         current_dir = self.settings_manager.settings.save_directory
         
         try:
-            dir_prompt = Text()
-            dir_prompt.append("Enter save directory path", style=Colors.INFO)
-            
-            new_dir = Prompt.ask(dir_prompt, default=current_dir)
-            
-            # Clear screen after input
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-            self.console.clear()
             
+            new_dir = Prompt.ask(_SAVE_DIR_PROMPT, default=current_dir)
+
+            # Reset the view after input without a full repaint
+            self._cursor_home()
+
             if os.path.exists(new_dir) or new_dir == current_dir:
                 self.settings_manager.update_setting("save_directory", new_dir)
-                success_panel = Panel(
-                    f"Save directory changed to: {new_dir}",
-                    style=Colors.SUCCESS,
-                    border_style=Colors.SUCCESS
-                )
-                self.console.print(success_panel)
+                self._flash(f"Save directory changed to: {new_dir}", Colors.SUCCESS)
             else:
-                error_panel = Panel(
-                    f"Directory '{new_dir}' does not exist or is not writable.",
-                    style=Colors.ERROR,
-                    border_style=Colors.ERROR
-                )
-                self.console.print(error_panel)
+                self._flash(f"Directory '{new_dir}' does not exist or is not writable.", Colors.ERROR)
         except OSError as e:
-            error_panel = Panel(
-                f"Could not create directory: {e}",
-                style=Colors.ERROR,
-                border_style=Colors.ERROR
-            )
-            self.console.print(error_panel)
-        
-        time.sleep(2)
+            self._flash(f"Could not create directory: {e}", Colors.ERROR)
     
     def _change_max_history_turns(self):
         """Change the maximum number of turns for history."""
@@ -1064,36 +1201,18 @@ History Length Guide:
         self.console.print(info_panel)
         
         try:
-            turns_prompt = Text()
-            turns_prompt.append("Enter history length (10-200)", style=Colors.INFO)
             
-            new_turns = IntPrompt.ask(turns_prompt, default=current_turns)
+            from rich.prompt import IntPrompt
+            new_turns = IntPrompt.ask(_HISTORY_PROMPT, default=current_turns)
             
             if 10 <= new_turns <= 200:
                 self.settings_manager.update_setting("max_history_turns", new_turns)
-                success_panel = Panel(
-                    f"History length changed to: {new_turns} turns",
-                    style=Colors.SUCCESS,
-                    border_style=Colors.SUCCESS
-                )
-                self.console.print(success_panel)
+                self._flash(f"History length changed to: {new_turns} turns", Colors.SUCCESS)
             else:
-                error_panel = Panel(
-                    "History length must be between 10 and 200!",
-                    style=Colors.ERROR,
-                    border_style=Colors.ERROR
-                )
-                self.console.print(error_panel)
-                
+                self._flash("History length must be between 10 and 200!", Colors.ERROR)
+
         except ValueError:
-            error_panel = Panel(
-                "Invalid history length value!",
-                style=Colors.ERROR,
-                border_style=Colors.ERROR
-            )
-            self.console.print(error_panel)
-        
-        time.sleep(2)
+            self._flash("Invalid history length value!", Colors.ERROR)
     
     def _toggle_auto_save(self):
         """Toggle auto-save setting."""
@@ -1102,14 +1221,7 @@ History Length Guide:
         
         self.settings_manager.update_setting("auto_save", new_setting)
         status = "enabled" if new_setting else "disabled"
-        
-        status_panel = Panel(
-            f"Auto-save {status}",
-            style=Colors.SUCCESS,
-            border_style=Colors.SUCCESS
-        )
-        self.console.print(status_panel)
-        time.sleep(1)
+        self._flash(f"Auto-save {status}", Colors.SUCCESS)
     
     def _toggle_debug_mode(self):
         """Toggle debug mode."""
@@ -1118,37 +1230,38 @@ History Length Guide:
         
         self.settings_manager.update_setting("show_debug_info", new_setting)
         status = "enabled" if new_setting else "disabled"
-        
-        status_panel = Panel(
-            f"Debug mode {status}",
-            style=Colors.SUCCESS,
-            border_style=Colors.SUCCESS
-        )
-        self.console.print(status_panel)
-        time.sleep(1)
+        self._flash(f"Debug mode {status}", Colors.SUCCESS)
     
     def _reset_settings(self):
         """Reset settings to defaults."""
-        reset_prompt = Text()
-        reset_prompt.append("Reset all settings to defaults?", style=Colors.WARNING)
         
-        if Confirm.ask(reset_prompt, default=False):
+        if Confirm.ask(_RESET_CONFIRM_PROMPT, default=False):
             self.settings_manager.reset_to_defaults()
-            success_panel = Panel(
-                "Settings reset to defaults",
-                style=Colors.SUCCESS,
-                border_style=Colors.SUCCESS
-            )
-            self.console.print(success_panel)
-            time.sleep(2)
+            self._flash("Settings reset to defaults", Colors.SUCCESS)
     
+    def _write_static_frame(self, frame_bytes: bytes) -> None:
+        """Blit a pre-rendered ANSI frame straight to stdout, bypassing Rich."""
+        sys.stdout.buffer.write(frame_bytes)
+        sys.stdout.buffer.flush()
+        self._last_frame = None
+
     def show_about(self):
         """Show clean about screen with centered text."""
-        self.clear_screen()
-        self.console.print("\n" * 2)
-        title_text = Text(SIMPLE_TITLE, style=Colors.TITLE)
-        self.console.print(Align.center(title_text))
-        self.console.print()
+        if self._about_ansi is None:
+            if self._about_panel is None:
+                self._about_panel = self._build_about_panel()
+            with self.console.capture() as capture:
+                self.console.print(Group(
+                    Text("\n"), Align.center(_SIMPLE_TITLE_TEXT), Text(""),
+                    Align.center(self._about_panel), Text("")
+                ))
+            self._about_ansi = ("\x1b[2J\x1b[H" + capture.get()).encode("utf-8")
+        self._write_static_frame(self._about_ansi)
+        Prompt.ask(_RETURN_PROMPT, default="")
+
+    @staticmethod
+    def _build_about_panel() -> Panel:
+        """Build the static about panel (cached by show_about)."""
         about_lines = [
             "Welcome to the realm of infinite possibilities!",
             "",
@@ -1188,23 +1301,29 @@ History Length Guide:
             padding=(2, 4),
             width=85
         )
-        self.console.print(Align.center(about_panel))
-        self.console.print()
-        return_prompt = Text()
-        return_prompt.append("Press Enter to return to menu...", style=Colors.MUTED)
-        Prompt.ask(return_prompt, default="")
+        return about_panel
 
     def confirm_quit(self) -> bool:
         """Elegant quit confirmation."""
-        quit_prompt = Text()
-        quit_prompt.append("Are you sure you want to leave this magical realm?", style=Colors.WARNING)
         
-        return Confirm.ask(quit_prompt, default=False)
+        return Confirm.ask(_QUIT_CONFIRM_PROMPT, default=False)
     
     def show_farewell(self):
         """Show clean farewell message with centered text."""
-        self.clear_screen()
-        self.console.print("\n" * 3)
+        if self._farewell_ansi is None:
+            if self._farewell_panel is None:
+                self._farewell_panel = self._build_farewell_panel()
+            with self.console.capture() as capture:
+                self.console.print(Group(
+                    Text("\n\n"), Align.center(self._farewell_panel), Text("\n")
+                ))
+            self._farewell_ansi = ("\x1b[2J\x1b[H" + capture.get()).encode("utf-8")
+        self._write_static_frame(self._farewell_ansi)
+        time.sleep(2)
+
+    @staticmethod
+    def _build_farewell_panel() -> Panel:
+        """Build the static farewell panel (cached by show_farewell)."""
         farewell_lines = [
             "Until we meet again, brave adventurer!",
             "",
@@ -1216,7 +1335,7 @@ History Length Guide:
             "",
             "Farewell, and may legends be told of your deeds!"
         ]
-        farewell_group = Group(*[Align.center(Text(line, style=Colors.ACCENT)) for line in farewell_lines])
+        farewell_group = _centered_block(farewell_lines, Colors.ACCENT)
         farewell_panel = Panel(
             farewell_group,
             title="Farewell, Hero!",
@@ -1226,6 +1345,4 @@ History Length Guide:
             padding=(3, 5),
             width=70
         )
-        self.console.print(Align.center(farewell_panel))
-        self.console.print("\n" * 2)
-        time.sleep(2) 
\ No newline at end of file
+        return farewell_panel 
\ No newline at end of file
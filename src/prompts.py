@@ -10,13 +10,13 @@ CRITICAL INSTRUCTIONS:
 - The JSON must be properly formatted and parseable
 
 The JSON object MUST contain exactly these keys:
-{{
+{
     "narrative": "A string describing the outcome of the player's action and what happens next",
     "location": "A string for the player's current location",
     "hp_change": 0,  // Integer: negative for damage, positive for healing, 0 for no change
     "items_added": [],  // Array of strings for items the player finds/receives
     "items_removed": []  // Array of strings for items the player uses/loses
-}}
+}
 
 Game Guidelines:
 - Create vivid, immersive descriptions of the fantasy world
@@ -29,7 +29,33 @@ Game Guidelines:
 
 Remember: Respond ONLY with the JSON object, no other text whatsoever."""
 
-GAME_PROMPT_TEMPLATE = """Current Game State:
+# The builders below are f-string functions rather than str.format templates:
+# the literal fragments are compiled once, so per-turn prompt construction
+# does no template parsing.
+
+def build_new_game_prompt(name: str, race: str, character_class: str, background: str,
+                          strength: int, dexterity: int, constitution: int,
+                          intelligence: int, wisdom: int, charisma: int) -> str:
+    """Build the opening prompt for a freshly created character.
+
+    Static instructions come first and character data last so the prompt
+    prefix stays identical across characters and Ollama can reuse its KV cache.
+    """
+    return f"""Start a new D&D-style fantasy RPG adventure. The player begins in a village square, having just arrived to start their adventuring career. Create an engaging opening scenario that reflects their background and abilities, setting up meaningful choices and potential for adventure.
+
+New Character:
+Name: {name}
+Race: {race}
+Class: {character_class}
+Background: {background}
+Stats: STR {strength}, DEX {dexterity}, CON {constitution}, INT {intelligence}, WIS {wisdom}, CHA {charisma}"""
+
+
+def build_game_prompt(player_name: str, current_hp: int, max_hp: int,
+                      current_location: str, inventory: str,
+                      story_history: str, user_input: str) -> str:
+    """Build the per-turn game prompt from the current game state."""
+    return f"""Current Game State:
 Player Name: {player_name}
 Current HP: {current_hp}/{max_hp}
 Current Location: {current_location}
@@ -2,13 +2,33 @@
 Settings and configuration management for Dungeons & Daemons.
 """
 
+import atexit
 import json
 import os
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import threading
+import time
+from typing import ClassVar, Dict, Any, Optional
+from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize settings to indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse settings JSON bytes, via orjson when available."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+@dataclass(slots=True)
 class GameSettings:
     """Game configuration settings."""
     # AI Settings
@@ -28,26 +48,61 @@ class GameSettings:
     ollama_host: str = "localhost"
     ollama_port: int = 11434
 
+    # Field names accepted from persisted settings, computed once at class
+    # creation instead of per from_dict/load call
+    _VALID_FIELDS: ClassVar[frozenset] = frozenset((
+        'ai_model', 'ai_temperature', 'save_directory', 'max_history_turns',
+        'auto_save', 'show_debug_info', 'animation_speed',
+        'ollama_host', 'ollama_port',
+    ))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary."""
-        return asdict(self)
+        # Flat scalars only, so a literal beats asdict's reflective deep copy
+        return {
+            "ai_model": self.ai_model,
+            "ai_temperature": self.ai_temperature,
+            "save_directory": self.save_directory,
+            "max_history_turns": self.max_history_turns,
+            "auto_save": self.auto_save,
+            "show_debug_info": self.show_debug_info,
+            "animation_speed": self.animation_speed,
+            "ollama_host": self.ollama_host,
+            "ollama_port": self.ollama_port,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GameSettings':
         """Create settings from dictionary, filtering unknown fields."""
-        # Get only the fields that exist in GameSettings
-        valid_fields = {field.name for field in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
-        return cls(**filtered_data)
+        # Set intersection runs in C; only known fields reach the constructor
+        return cls(**{k: data[k] for k in data.keys() & cls._VALID_FIELDS})
 
 
 class SettingsManager:
     """Manages loading, saving, and updating game settings."""
     
+    # How long a fetched model list stays fresh before re-querying Ollama
+    _MODELS_CACHE_TTL = 30.0
+
+    # How long to coalesce rapid setting changes before writing the file
+    _SAVE_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self, settings_file: str = "settings.json"):
         self.settings_file = settings_file
         self.settings = self.load_settings()
-        
+
+        # Cached `ollama list` result; spawning the subprocess per menu
+        # visit is the dominant settings-menu latency
+        self._models_cache: Optional[list] = None
+        self._models_cache_ts = 0.0
+
+        # Debounced persistence: rapid toggles coalesce into one write,
+        # and the atexit hook guarantees the last state still lands
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._settings_dirty = False
+        atexit.register(self._flush)
+
         # Ensure save directory exists
         os.makedirs(self.settings.save_directory, exist_ok=True)
     
@@ -55,28 +110,29 @@ class SettingsManager:
         """Load settings from file or create defaults."""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    data = _loads(f.read())
                 
                 # Check if we're loading an old format and provide feedback
-                valid_fields = {field.name for field in GameSettings.__dataclass_fields__.values()}
-                unknown_fields = set(data.keys()) - valid_fields
+                unknown_fields = data.keys() - GameSettings._VALID_FIELDS
                 if unknown_fields:
                     print(f"Settings file contains unknown fields: {', '.join(unknown_fields)}")
                     print("These will be ignored and reset to defaults.")
                 
                 return GameSettings.from_dict(data)
-        except (json.JSONDecodeError, KeyError, FileNotFoundError, TypeError) as e:
+        except (ValueError, KeyError, FileNotFoundError, TypeError) as e:
             print(f"Could not load settings: {e}")
             print("Using default settings.")
         
         return GameSettings()
     
     def save_settings(self) -> bool:
-        """Save current settings to file."""
+        """Save current settings to file atomically (write temp, then rename)."""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings.to_dict(), f, indent=2)
+            tmp_path = self.settings_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self.settings.to_dict()))
+            os.replace(tmp_path, self.settings_file)
             return True
         except Exception as e:
             print(f"Failed to save settings: {e}")
@@ -87,13 +143,56 @@ class SettingsManager:
         return os.path.join(self.settings.save_directory, filename)
     
     def get_available_models(self) -> list:
-        """Get list of available Ollama models."""
+        """Get list of available Ollama models, cached for a short while."""
+        if (self._models_cache is not None
+                and time.monotonic() - self._models_cache_ts < self._MODELS_CACHE_TTL):
+            return self._models_cache
+
+        models = self._fetch_available_models()
+        self._models_cache = models
+        self._models_cache_ts = time.monotonic()
+        return models
+
+    def invalidate_models_cache(self) -> None:
+        """Drop the cached model list so the next query hits Ollama again."""
+        self._models_cache = None
+        self._models_cache_ts = 0.0
+
+    def _fetch_available_models(self) -> list:
+        """Query Ollama for installed models, preferring the local HTTP API.
+
+        A request to the running server avoids the fork/exec of the CLI and
+        works even when the `ollama` binary is not on PATH; the CLI stays as
+        a fallback for setups where the server is down but the CLI works.
+        """
+        models = self._fetch_models_http()
+        if models is None:
+            models = self._fetch_models_cli()
+        if models is not None:
+            return models
+
+        # Return default models if ollama cannot be reached either way
+        return ["llama3", "mistral", "codellama", "llama2"]
+
+    def _fetch_models_http(self) -> Optional[list]:
+        """List models via the Ollama /api/tags endpoint; None on failure."""
+        url = f"http://{self.settings.ollama_host}:{self.settings.ollama_port}/api/tags"
+        try:
+            import urllib.request
+            with urllib.request.urlopen(url, timeout=0.5) as response:
+                tags = _loads(response.read())
+            return [model['name'] for model in tags.get('models', ())]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _fetch_models_cli(self) -> Optional[list]:
+        """List models by running `ollama list`; None on failure."""
         try:
             import subprocess
             result = subprocess.run(['ollama', 'list'], 
                                   capture_output=True, 
                                   text=True, 
-                                  timeout=5)
+                                  timeout=1.5)
             
             if result.returncode == 0:
                 lines = result.stdout.strip().split('\n')[1:]  # Skip header
@@ -106,24 +205,51 @@ class SettingsManager:
             
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
             pass
-        
-        # Return default models if ollama command fails
-        return ["llama3", "mistral", "codellama", "llama2"]
+        return None
     
     def validate_model(self, model_name: str) -> bool:
         """Check if a model is available."""
         return model_name in self.get_available_models()
     
     def update_setting(self, key: str, value: Any) -> bool:
-        """Update a specific setting."""
+        """Update a specific setting; the save is debounced, not immediate."""
         if hasattr(self.settings, key):
+            if getattr(self.settings, key) == value:
+                return True  # no-op update; skip the disk write entirely
             setattr(self.settings, key, value)
-            return self.save_settings()
+            self._schedule_save()
+            return True
         return False
+
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)start the debounce timer."""
+        with self._save_lock:
+            self._settings_dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self._SAVE_DEBOUNCE_SECONDS, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self) -> None:
+        """Write pending changes to disk, if any."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._settings_dirty:
+                return
+            self._settings_dirty = False
+        self.save_settings()
     
     def reset_to_defaults(self) -> bool:
-        """Reset all settings to defaults."""
-        self.settings = GameSettings()
+        """Reset all settings to defaults and persist immediately."""
+        defaults = GameSettings()
+        if self.settings == defaults:
+            return True  # already at defaults; nothing to write
+        self.settings = defaults
+        with self._save_lock:
+            self._settings_dirty = False
         return self.save_settings()
     
     def get_settings_summary(self) -> str: